@@ -1,12 +1,23 @@
 # Import libraries with error handling for environment issues
 try:
     import pandas as pd
+    import numpy as np
     PANDAS_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: pandas not available: {e}")
     pd = None
+    np = None
     PANDAS_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pc = None
+    PYARROW_AVAILABLE = False
+
 try:
     import seaborn as sns
     SEABORN_AVAILABLE = True
@@ -14,21 +25,28 @@ except ImportError:
     sns = None
     SEABORN_AVAILABLE = False
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import functools
 import re
 import os
+import shutil
+import hashlib
 import tempfile
 
 # Import matplotlib with error handling
 try:
     import matplotlib
-    # Don't set backend here - let it be set by the GUI when needed
+    # Charts are rendered off-screen (saved, embedded in PDFs, or drawn onto the
+    # GUI's own TkAgg canvas), so start on Agg and never initialize a GUI backend
+    # for batch runs; the GUI still switches to TkAgg when it embeds charts.
+    # Set CASHAPP_INTERACTIVE=1 to keep matplotlib's default backend.
+    if os.environ.get('CASHAPP_INTERACTIVE') != '1':
+        matplotlib.use('Agg')
     import matplotlib.pyplot as plt
-    import numpy as np
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     plt = None
-    np = None
     MATPLOTLIB_AVAILABLE = False
 
 # Import our new utilities
@@ -44,79 +62,471 @@ except ImportError:
     def log_performance(func):
         return func
 
+
+# Timestamp layout of Cash App CSV exports once the time zone is removed
+EXPORT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Trailing 3-letter time zone ("EDT", "EST"), compiled once for every load
+ZONE_SUFFIX_RE = re.compile(r'\s+[A-Z]{3}$')
+
+# Low-cardinality text columns in Cash App exports; declaring them up front
+# skips pandas' type inference pass and stores each label only once
+CATEGORICAL_COLUMNS = {
+    'Transaction Type': 'category',
+    'Currency': 'category',
+    'Status': 'category',
+    'Asset Type': 'category',
+}
+
+
+# Cash card merchant keywords by category, in priority order: the first
+# category with a keyword found in the merchant name wins
+MERCHANT_CATEGORY_KEYWORDS = (
+    ('Food & Dining', (
+        'CHIPOTLE', 'MCDONALD', 'STARBUCKS', 'WAFFLE HOUSE', 'WHATABURGER',
+        'ZAXBY', 'MARCOS PIZZA', 'JETS PIZZA', 'TROPICAL SMOOTHIE', 'DELI',
+        'JAX BEACH BRUNCH', 'RESTAURANT', 'QUE ONDA', 'HABERDISH', 'SAKE HOUSE',
+        'CREPE', 'WINN-DIXIE', 'JUICE TAP', 'AKELS DELI', 'ANDREW`S DELI',
+        'PENMAN HOSPITALITY', 'GEMMA FISH OYSTER', 'WORKMAN\'S FRIEND',
+        'FRENCHY\'S SIP', 'SPO*LACOCINAMEXICANARESTA',
+    )),
+    ('Entertainment & Media', (
+        'NETFLIX', 'SPOTIFY', 'YOUTUBE', 'STEAM', 'ROKU', 'MAX.COM', 'DECCA LIVE',
+        'HOPTINGER', 'SURFER THE BAR', 'BRIX TAPHOUSE', 'STEAMGAMES.COM',
+    )),
+    ('Gas & Travel', (
+        'LOVE\'S', '7-ELEVEN', 'AMERICAN AIRLINES', 'XPRESS SHOP',
+    )),
+    ('Healthcare & Fitness', (
+        'DENTAL', 'MEDICAL', 'CRUNCH FITNESS', 'WEST BEACHES DENTAL',
+    )),
+    ('Golf & Recreation', (
+        'GOLF', 'MUNICIPAL', 'WHITEWATER', 'HULAWEENTIX', 'CAROLINA LAKES GOL',
+        'ST AUGUSTINE SHORES GC', 'JCKSNVL BCH MUNICPL GL', 'JACKSONVILLE BEACH GOLF',
+        'BLUE SKY GOLF CLUB', 'MARSH LANDING COUNTRY CLU',
+    )),
+    ('Subscriptions & Services', (
+        'APPLE.COM', 'GOOGLE', 'MICROSOFT', 'COMCAST', 'OBSIDIAN', 'KINDLE SVCS',
+        'HELP.MAX.COM', 'CLKBANK*VINCHECKUP', 'THE ROKU CHANNEL',
+    )),
+    ('Shopping', (
+        'AMAZON', 'WALGREENS', 'SUNRISE SURF', 'ARGYLE', 'SP FREAK ATHLETE',
+        'SP TITAN FITNESS', 'NNT MENS WEARHOUSE',
+    )),
+    ('Transportation', (
+        'CDOT PAY BY CELL',
+    )),
+    ('Insurance & Financial', (
+        'STATE FARM', 'CAPITAL ONE', 'APPLE CASH SENT MONEY',
+    )),
+    # Housing (Rent/Utilities)
+    ('Housing & Rent', (
+        'YSI*PROGRESS RESIDENTIAL', 'PROGRESS RESIDENTIAL',
+    )),
+    ('Travel & Tourism', (
+        'VIATORTRIPADVISOR', 'AIRBNB', 'FGT*HULAWEENTIX',
+    )),
+)
+
+# One compiled alternation per category, so each category is a single regex scan
+_MERCHANT_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in MERCHANT_CATEGORY_KEYWORDS
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _merchant_category(merchant):
+    """Category for an upper-cased merchant name; repeat merchants hit the cache"""
+    for category, pattern in _MERCHANT_CATEGORY_PATTERNS:
+        if pattern.search(merchant):
+            return category
+    return 'Other Expenses'
+
+
+def _merchant_categories(merchants):
+    """Vectorized _merchant_category for a Series of upper-cased merchant names
+
+    Distinct merchants are matched against the category patterns in
+    MERCHANT_CATEGORY_KEYWORDS order. Once a merchant matches it is dropped
+    from later scans, so the first matching category wins and each pattern
+    only sees the merchants still unresolved.
+    """
+    uniques = merchants.unique()
+    categories = np.full(len(uniques), 'Other Expenses', dtype=object)
+    unresolved = pd.Series(uniques, dtype=object)
+    for category, pattern in _MERCHANT_CATEGORY_PATTERNS:
+        if unresolved.empty:
+            break
+        matched = unresolved.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        categories[unresolved.index[matched]] = category
+        unresolved = unresolved[~matched]
+    return merchants.map(dict(zip(uniques, categories)))
+
+
+def _contains_ignore_case(series, substring):
+    """Case-insensitive literal substring match that treats missing values as no match"""
+    if PYARROW_AVAILABLE:
+        # Arrow scans contiguous UTF-8 buffers instead of calling re.search per row
+        values = pa.array(series.astype('string'), type=pa.string())
+        matches = pc.match_substring(values, substring, ignore_case=True)
+        return pd.Series(
+            pc.fill_null(matches, False).to_numpy(zero_copy_only=False), index=series.index
+        )
+    return series.str.contains(substring, case=False, na=False, regex=False)
+
+
+def _value_masks(series, values):
+    """Boolean mask per value from a single factorization of the column
+
+    Each mask is an integer compare against the factorized codes rather than
+    another full comparison of the (string or categorical) column.
+    """
+    codes, uniques = pd.factorize(series)
+    positions = pd.Index(uniques).get_indexer(values)
+    return {
+        # Values absent from the column get -1, which is also the code of missing entries
+        value: pd.Series(codes == position if position >= 0 else np.zeros(len(codes), dtype=bool),
+                         index=series.index)
+        for value, position in zip(values, positions)
+    }
+
+
+def _month_keys(dates):
+    """YYYYMM int32 key (e.g. 202401); missing dates become <NA>
+
+    Avoids building a PeriodArray; use _month_labels for display. The key is
+    narrowed to int32 so groupby hashing scans half the bytes of int64, and it
+    sorts chronologically while staying readable in grouped output.
+    """
+    months = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+    missing = np.isnat(months)
+    # Months since 1970-01, split into year and month arithmetically
+    offsets = np.where(missing, 0, months.view('int64'))
+    keys = ((offsets // 12 + 1970) * 100 + offsets % 12 + 1).astype('int32')
+    if missing.any():
+        return pd.arrays.IntegerArray(keys, missing)
+    return keys
+
+
+def _month_labels(keys):
+    """'YYYY-MM' labels for Month_Year keys (chart ticks, text and PDF reports)"""
+    keys = np.asarray(keys, dtype='int64')
+    return [f"{key // 100}-{key % 100:02d}" for key in keys.tolist()]
+
+
+def _user_cache_dir(name):
+    """Per-user cache location for derived transaction data
+
+    Cached frames and reports contain personal financial data, so they live
+    under the user's own cache directory rather than the shared system tempdir.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME')
+    base = base or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cashapp-analyzer', name)
+
+
+def _ensure_private_dir(path):
+    """Create a cache directory readable only by the current user"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    # makedirs is subject to the umask and leaves existing directories alone
+    os.chmod(path, 0o700)
+
+
+def _atomic_write(path, write):
+    """Call write(temp_path), then move the result into place in one step
+
+    Readers (including parallel test workers) never see a half-written file;
+    the temporary file is removed if writing fails.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _prune_cache(directory, suffix, max_entries):
+    """Delete all but the max_entries most recently used cache files"""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith(suffix):
+            entries.append((entry.stat().st_mtime, entry.path))
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Already removed by another process
+
+
+# Built PDF reports, named by a digest of the data they were built from;
+# only the most recently used reports are kept
+PDF_CACHE_DIR = _user_cache_dir('pdf')
+PDF_CACHE_MAX_ENTRIES = 32
+
+# Bumped whenever the report output changes (layout, charts or text), so
+# reports built by an older version are never served for unchanged data
+PDF_CACHE_VERSION = 1
+
+
+def _frame_digest(df, *extra):
+    """Content hash of a DataFrame (values and index) plus any extra key parts"""
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).values.tobytes(), digest_size=16)
+    for part in extra:
+        digest.update(str(part).encode())
+    return digest.hexdigest()
+
+
+def _file_cache_key(path):
+    """Identify a CSV file by path, modification time and size"""
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+# Cleaned frames of previously loaded CSVs, stored as Parquet when pyarrow is installed;
+# only the most recently used entries are kept
+CLEANED_CACHE_DIR = _user_cache_dir('csv')
+CLEANED_CACHE_MAX_ENTRIES = 16
+
+# Bumped whenever the cleaned frame's layout changes (e.g. the Month_Year
+# encoding), so entries written by an older version are never read back
+CLEANED_CACHE_VERSION = 3
+
+
+def _cleaned_cache_path(source_key):
+    """Parquet cache file for a CSV identified by _file_cache_key
+
+    The key includes mtime and size, so an edited CSV never matches an old entry.
+    """
+    path, mtime_ns, size = source_key
+    name = hashlib.blake2b(
+        f"{CLEANED_CACHE_VERSION}|{os.path.abspath(path)}|{mtime_ns}|{size}".encode(), digest_size=16
+    ).hexdigest()
+    return os.path.join(CLEANED_CACHE_DIR, f"{name}.parquet")
+
+
+# Categorized frames of unchanged files, keyed by _file_cache_key and filled
+# from the frame the caller already loaded; callers store and read copies
+_CATEGORIZED_CACHE = OrderedDict()
+_CATEGORIZED_CACHE_SIZE = 8
+
+
 class CashAppAnalyzer:
     def __init__(self, csv_file_path=None):
-        """Initialize the analyzer with CSV file path"""
+        """Initialize the analyzer with a CSV file path or a readable file-like object"""
         self.csv_file_path = csv_file_path
         self.df = None
         self.monthly_data = None
         self.start_date = None
         self.end_date = None
+        self._source_key = None
+        self._loaded_df = None
+        
+    def load_and_clean_data(self, chunksize=None):
+        """Load CSV (or a typed Parquet copy of it) and clean the data
         
-    def load_and_clean_data(self):
-        """Load CSV and clean the data"""
+        With chunksize set, the CSV is read and cleaned in chunks of that many
+        rows so the string temporaries of a large export are never all held
+        in memory at once.
+        
+        When pyarrow is installed, whole-file reads use its multi-threaded CSV
+        parser, and the cleaned frame of a CSV file is cached as Parquet and
+        reused until the CSV changes; set CASHAPP_CSV_NO_CACHE=1 to always
+        parse the CSV.
+        """
         if not PANDAS_AVAILABLE:
             raise ImportError("pandas is not available - cannot load CSV data")
             
         if not self.csv_file_path:
             raise ValueError("CSV file path is required")
             
-        # Read CSV file
-        self.df = pd.read_csv(self.csv_file_path)
+        # In-memory sources are rewound so the same buffer can be loaded again
+        is_file_like = hasattr(self.csv_file_path, 'read')
+        if is_file_like and hasattr(self.csv_file_path, 'seek'):
+            self.csv_file_path.seek(0)
+        
+        is_parquet = str(self.csv_file_path).lower().endswith('.parquet')
+        source_key = None if is_file_like else _file_cache_key(self.csv_file_path)
+        cache_path = None
+        if (source_key is not None and not is_parquet and PYARROW_AVAILABLE
+                and os.environ.get('CASHAPP_CSV_NO_CACHE') != '1'):
+            cache_path = _cleaned_cache_path(source_key)
+        
+        cached = cache_path is not None and os.path.exists(cache_path)
+        
+        if cached:
+            try:
+                cached_df = pd.read_parquet(cache_path)
+                os.utime(cache_path)  # Mark as recently used for pruning
+            except (OSError, ValueError, pa.ArrowException):
+                # A corrupt or truncated entry is dropped and the CSV parsed instead
+                cached = False
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+        
+        # Read the transaction file; Parquet is already typed so it skips text parsing
+        if cached:
+            self.df = cached_df
+        elif is_parquet:
+            self.df = self._clean_frame(pd.read_parquet(self.csv_file_path))
+        elif chunksize:
+            chunks = pd.read_csv(self.csv_file_path, dtype=CATEGORICAL_COLUMNS, chunksize=chunksize)
+            self.df = pd.concat((self._clean_frame(chunk) for chunk in chunks), ignore_index=True)
+        else:
+            # Arrow's CSV reader tokenizes on multiple threads; it has no chunked mode
+            engine = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+            self.df = self._clean_frame(
+                pd.read_csv(self.csv_file_path, dtype=CATEGORICAL_COLUMNS, engine=engine)
+            )
         
+        # Chunks may see different category sets, which concat widens to object
+        self.df = self.df.astype(
+            {col: dtype for col, dtype in CATEGORICAL_COLUMNS.items() if col in self.df.columns}
+        )
+        
+        if cache_path and not cached:
+            try:
+                _ensure_private_dir(CLEANED_CACHE_DIR)
+                _atomic_write(cache_path, lambda temp_path: self.df.to_parquet(
+                    temp_path, compression='zstd', index=False
+                ))
+                _prune_cache(CLEANED_CACHE_DIR, '.parquet', CLEANED_CACHE_MAX_ENTRIES)
+            except (OSError, ValueError, pa.ArrowException):
+                # Columns Arrow cannot type (e.g. mixed objects) just go uncached
+                pass
+        
+        # Remember what was loaded so categorization can reuse cached results;
+        # file-like sources have no stable identity and are never cached
+        self._source_key = source_key
+        self._loaded_df = self.df
+        
+        return self
+    
+    def _clean_frame(self, df):
+        """Normalize dates, amounts and descriptions of a raw transaction frame"""
         # Clean date format
         date_columns = ['Date', 'Transaction Date', 'date', 'transaction_date']
         date_col = None
         for col in date_columns:
-            if col in self.df.columns:
+            if col in df.columns:
                 date_col = col
                 break
 
         if date_col:
-            # Remove unrecognized timezones (e.g. "EDT", "EST") and convert to datetime
-            self.df['Date'] = pd.to_datetime(
-                self.df[date_col].str.replace(r'\s+[A-Z]{3}$', '', regex=True),
-                errors='coerce'
-            )
+            df['Date'] = self._parse_dates(df[date_col])
         else:
-            for col in self.df.columns:
+            for col in df.columns:
                 if 'date' in col.lower():
-                    self.df['Date'] = pd.to_datetime(
-                        self.df[col].str.replace(r'\s+[A-Z]{3}$', '', regex=True),
-                        errors='coerce'
-                    )
+                    df['Date'] = self._parse_dates(df[col])
                     break
         
         # Clean amount columns - look for net amount, amount, etc.
         amount_columns = ['Net Amount', 'Amount', 'net_amount', 'amount', 'Net', 'Total']
         amount_col = None
         for col in amount_columns:
-            if col in self.df.columns:
+            if col in df.columns:
                 amount_col = col
                 break
         
-        if amount_col:
-            # Clean amount column - remove $ signs and convert to float
-            self.df['Net_Amount'] = self.df[amount_col].astype(str).str.replace('$', '').str.replace(',', '')
-            self.df['Net_Amount'] = pd.to_numeric(self.df['Net_Amount'], errors='coerce')
+        if amount_col and pd.api.types.is_numeric_dtype(df[amount_col]):
+            # Already numeric (e.g. loaded from Parquet)
+            df['Net_Amount'] = df[amount_col]
+        elif amount_col:
+            # Clean amount column - strip $ signs and thousands separators in one
+            # regex pass; text columns are used as-is instead of copied via astype(str)
+            amounts = df[amount_col]
+            if not pd.api.types.is_string_dtype(amounts):
+                amounts = amounts.astype(str)
+            # Kept as float64; float32 cannot represent cents exactly enough for the amount rules
+            df['Net_Amount'] = pd.to_numeric(amounts.str.replace(r'[$,]', '', regex=True), errors='coerce')
         
         # Create Description column from Notes for compatibility
-        if 'Notes' in self.df.columns:
-            self.df['Description'] = self.df['Notes']
-        elif 'Description' not in self.df.columns:
+        if 'Notes' in df.columns:
+            df['Description'] = df['Notes']
+        elif 'Description' not in df.columns:
             # If neither Notes nor Description exists, create a generic description
-            self.df['Description'] = 'Transaction'
+            df['Description'] = 'Transaction'
         
-        # Extract month-year for grouping
-        self.df['Month_Year'] = self.df['Date'].dt.to_period('M')
+        # Extract month-year for grouping as an integer month key
+        df['Month_Year'] = _month_keys(df['Date'])
         
-        return self
+        return df
+    
+    @staticmethod
+    def _parse_dates(series):
+        """Convert a date column to datetime64[ns]
+        
+        The resolution pandas infers differs by reader (the pyarrow engine
+        yields seconds, the C engine microseconds), so every path is normalized
+        to nanoseconds and all engines produce identical frames.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.astype('datetime64[ns]')
+        
+        # Cash App exports end every timestamp with a 3-letter zone ("EDT", "EST")
+        # that pandas cannot parse; when the first value has one, slice it off
+        # instead of running a regex over every row
+        first = series.dropna()
+        has_zone = not first.empty and ZONE_SUFFIX_RE.search(str(first.iloc[0])) is not None
+        trimmed = series.str[:-4] if has_zone else series
+        
+        # The export's fixed format takes the fast strptime path; cache=True
+        # parses repeated timestamps once
+        parsed = pd.to_datetime(trimmed, format=EXPORT_DATE_FORMAT, errors='coerce', cache=True)
+        
+        # Anything else (date-only values, rows without a zone) falls back to
+        # stripping the zone with a regex and letting pandas infer the format
+        failed = parsed.isna() & series.notna()
+        if failed.any():
+            fallback = pd.to_datetime(
+                series[failed].str.replace(ZONE_SUFFIX_RE, '', regex=True),
+                errors='coerce'
+            )
+            if failed.all():
+                return fallback.astype('datetime64[ns]')
+            parsed[failed] = fallback
+        return parsed.astype('datetime64[ns]')
     
     def categorize_transactions(self):
-        """Categorize transactions based on user's rules and transaction types"""
-        # Initialize categories based on transaction type and notes
-        self.df['Category'] = 'Other'
+        """Categorize transactions based on user's rules and transaction types
+        
+        When self.df is still the frame produced by load_and_clean_data and the
+        file is unchanged on disk, a cached copy of the categorized data is used.
+        """
+        key = self._source_key
+        reusable = (key is not None and self.df is self._loaded_df
+                    and os.path.exists(self.csv_file_path)
+                    and _file_cache_key(self.csv_file_path) == key)
+        
+        if reusable and key in _CATEGORIZED_CACHE:
+            _CATEGORIZED_CACHE.move_to_end(key)
+            self.df = _CATEGORIZED_CACHE[key].copy()
+        else:
+            # Categorize the frame already in memory; the file is never read again here
+            self._apply_categories()
+            if reusable:
+                _CATEGORIZED_CACHE[key] = self.df.copy()
+                while len(_CATEGORIZED_CACHE) > _CATEGORIZED_CACHE_SIZE:
+                    _CATEGORIZED_CACHE.popitem(last=False)
+        
+        print(f"Categorization complete! Categories found: {self.df['Category'].value_counts().to_dict()}")
+    
+    def _apply_categories(self):
+        """Apply the categorization rules to self.df in place
         
+        All rules are resolved in one np.select pass, listed from highest to
+        lowest priority, so Category is written exactly once.
+        """
         # Determine which column to use for transaction descriptions
         description_col = None
         if 'Notes' in self.df.columns:
@@ -124,93 +534,45 @@ class CashAppAnalyzer:
         elif 'Description' in self.df.columns:
             description_col = 'Description'
         
+        # Factorize the transaction types once; every type rule below reads its mask from here
+        type_masks = _value_masks(self.df['Transaction Type'], [
+            'Bitcoin Buy', 'Bitcoin Recurring Buy', 'Savings Internal Transfer', 'Deposits',
+            'P2P', 'Cash Card', 'Withdrawal', 'Savings Interest Payment'
+        ])
+        amount = self.df['Net_Amount']
+        no_description = pd.Series(False, index=self.df.index)
+        
         # Rule 1: Energy Auth transactions = Income (only if description column exists)
         if description_col:
-            income_mask = self.df[description_col].str.contains('THE ENERGY AUTHO DIRECT DEP', case=False, na=False)
-            self.df.loc[income_mask, 'Category'] = 'Income'
-        
-        # Rule 2: Bitcoin purchases = Investment (only significant amounts to avoid micro-DCA noise)
-        if 'Transaction Type' in self.df.columns:
-            bitcoin_mask = (
-                ((self.df['Transaction Type'] == 'Bitcoin Buy') | 
-                 (self.df['Transaction Type'] == 'Bitcoin Recurring Buy')) &
-                (self.df['Net_Amount'].abs() >= 10.0)  # Only count Bitcoin purchases >= $10 as investments
-            )
-            self.df.loc[bitcoin_mask, 'Category'] = 'Investment (Bitcoin)'
-            
-            # Small Bitcoin purchases (< $10) are micro-DCA, categorize as regular expenses
-            small_bitcoin_mask = (
-                ((self.df['Transaction Type'] == 'Bitcoin Buy') | 
-                 (self.df['Transaction Type'] == 'Bitcoin Recurring Buy')) &
-                (self.df['Net_Amount'].abs() < 10.0)
-            )
-            self.df.loc[small_bitcoin_mask, 'Category'] = 'Micro-DCA (Bitcoin)'
+            income_mask = _contains_ignore_case(self.df[description_col], 'THE ENERGY AUTHO DIRECT DEP')
+            btc_note_mask = _contains_ignore_case(self.df[description_col], 'purchase of BTC')
+        else:
+            income_mask = btc_note_mask = no_description
         
-        # Rule 3: Savings Internal Transfer = Investment (DCA strategy) - only for specific amounts
-        # Differentiate between regular savings and Bitcoin savings based on description
-        if 'Transaction Type' in self.df.columns:
-            savings_mask = self.df['Transaction Type'] == 'Savings Internal Transfer'
-            
-            # Check description column for Bitcoin purchases
-            if description_col:
-                # Bitcoin savings transfers (contains "purchase of BTC")
-                bitcoin_savings_mask = (
-                    savings_mask & 
-                    self.df[description_col].str.contains('purchase of BTC', case=False, na=False)
-                )
-                self.df.loc[bitcoin_savings_mask, 'Category'] = 'Investment (Bitcoin Savings)'
-                
-                # For regular savings transfers, don't automatically make them investments
-                # They will be categorized later based on specific amounts
-                regular_savings_mask = savings_mask & ~bitcoin_savings_mask
-                self.df.loc[regular_savings_mask, 'Category'] = 'Savings Transfer'
-            else:
-                # If no description column, treat all savings transfers as regular transfers initially
-                self.df.loc[savings_mask, 'Category'] = 'Savings Transfer'
+        # Rule 2: Bitcoin purchases = Investment (only significant amounts to avoid micro-DCA noise);
+        # small Bitcoin purchases (< $10) are micro-DCA, categorized as regular expenses
+        bitcoin_buy_mask = type_masks['Bitcoin Buy'] | type_masks['Bitcoin Recurring Buy']
+        bitcoin_mask = bitcoin_buy_mask & (amount.abs() >= 10.0)
+        small_bitcoin_mask = bitcoin_buy_mask & (amount.abs() < 10.0)
+        
+        # Rule 3: Savings Internal Transfers containing "purchase of BTC" are Bitcoin savings;
+        # regular savings transfers are not automatically investments (see Rule 5)
+        savings_mask = type_masks['Savings Internal Transfer']
+        bitcoin_savings_mask = savings_mask & btc_note_mask
+        regular_savings_mask = savings_mask & ~bitcoin_savings_mask
         
         # Rule 4: Deposits = Money Movement (neutral) - exclude from income/expense calculations
-        if 'Transaction Type' in self.df.columns:
-            deposits_mask = self.df['Transaction Type'] == 'Deposits'
-            self.df.loc[deposits_mask, 'Category'] = 'Internal Transfer'
-        
-        # Rule 5: Identify specific DCA savings amounts and mark as investments
-        # DCA savings transfers (typically 10% of paycheck, varies with income)
-        # Only include specific paycheck-based amounts, not round amounts which are likely temporary transfers
-        # BUT exclude Bitcoin transactions which should already be categorized as Bitcoin investments
-        savings_amounts = [318.28]  # Conservative: only include confirmed paycheck-based DCA amounts
-        
-        # Create masks for confirmed DCA amounts - these are investments, not internal transfers
-        # Only apply to Savings Internal Transfer transactions that are NOT Bitcoin purchases
-        dca_masks = []
-        for amount in savings_amounts:
-            # Only negative amounts (outflows) should be considered DCA investments
-            # AND must be Savings Internal Transfer (not Bitcoin Buy)
-            dca_mask = (
-                (self.df['Net_Amount'] == -amount) &
-                (self.df['Transaction Type'] == 'Savings Internal Transfer') &
-                (~self.df['Transaction Type'].isin(['Bitcoin Buy', 'Bitcoin Recurring Buy']))
-            )
-            dca_masks.append(dca_mask)
+        deposits_mask = type_masks['Deposits']
         
-        # Combine all DCA masks and apply only to transactions not already categorized as Bitcoin
-        if dca_masks:
-            dca_savings_mask = dca_masks[0]
-            for mask in dca_masks[1:]:
-                dca_savings_mask = dca_savings_mask | mask
-            
-            # Only apply to transactions not already categorized as Bitcoin investments
-            existing_bitcoin_mask = self.df['Category'].isin(['Investment (Bitcoin)', 'Micro-DCA (Bitcoin)'])
-            final_dca_mask = dca_savings_mask & ~existing_bitcoin_mask
-            
-            self.df.loc[final_dca_mask, 'Category'] = 'Investment (DCA Savings)'
+        # Rule 5: Confirmed DCA savings amounts (typically 10% of paycheck) are investments.
+        # Only negative amounts (outflows) on Savings Internal Transfers count; round amounts
+        # are likely temporary transfers. Conservative: only confirmed paycheck-based amounts.
+        savings_amounts = [318.28]
+        dca_savings_mask = savings_mask & amount.isin([-value for value in savings_amounts])
         
         # Rent offset transfer ($1000) - this is fixed and is an internal transfer, not investment
         # Only apply to non-Bitcoin transactions to avoid misclassifying Bitcoin purchases
-        rent_offset_mask = (
-            ((self.df['Net_Amount'] == -1000.0) | (self.df['Net_Amount'] == 1000.0)) &
-            (~self.df['Transaction Type'].isin(['Bitcoin Buy', 'Bitcoin Recurring Buy']))
-        )
-        self.df.loc[rent_offset_mask, 'Category'] = 'Rent Offset (Internal)'
+        rent_offset_mask = amount.isin([-1000.0, 1000.0]) & ~bitcoin_buy_mask
         
         # Additional pattern: Look for other round investment amounts that might be DCA-based
         # DISABLED: User wants to ignore potential DCA amounts and only track confirmed DCA
@@ -219,137 +581,67 @@ class CashAppAnalyzer:
         #     (self.df['Transaction Type'] == 'Savings Internal Transfer') &
         #     (self.df['Net_Amount'] < 0)  # Only outflows should be considered investments
         # )
-        # # Only apply this to transactions not already categorized as DCA investments
-        # existing_investment_mask = self.df['Category'].str.contains('Investment', na=False)
-        # self.df.loc[potential_investment_mask & ~existing_investment_mask, 'Category'] = 'Potential DCA (Internal)'
         
         # Rule 6: P2P transactions - need to distinguish between actual expenses and internal transfers
-        p2p_mask = self.df['Transaction Type'] == 'P2P'
-        # Apply P2P category first, then we'll refine below
-        self.df.loc[p2p_mask, 'Category'] = 'P2P Transfer'
+        p2p_mask = type_masks['P2P']
         
         # Rule 7: Cash Card transactions - categorize by merchant (these are actual expenses)
-        cash_card_mask = self.df['Transaction Type'] == 'Cash Card'
-        cash_card_df = self.df[cash_card_mask]
-        
-        # Enhanced cash card categorization
-        for idx, row in cash_card_df.iterrows():
-            merchant = str(row.get('Notes', '')).upper()
-            category = self._categorize_cash_card_expense(merchant)
-            self.df.at[idx, 'Category'] = category
-        
-        # Handle other transaction types
-        withdrawal_mask = self.df['Transaction Type'] == 'Withdrawal'
-        self.df.loc[withdrawal_mask, 'Category'] = 'Withdrawal'
-        
-        interest_mask = self.df['Transaction Type'] == 'Savings Interest Payment'
-        self.df.loc[interest_mask, 'Category'] = 'Interest'
+        cash_card_mask = type_masks['Cash Card']
+        # Merchant categories are kept as positions in merchant_labels (last is 'Other Expenses')
+        merchant_labels = pd.Index([category for category, _ in MERCHANT_CATEGORY_KEYWORDS] + ['Other Expenses'])
+        merchant_codes = np.full(len(self.df), len(merchant_labels) - 1)
+        if 'Notes' in self.df.columns:
+            merchants = self.df.loc[cash_card_mask, 'Notes'].map(str).str.upper()
+            merchant_codes[cash_card_mask.to_numpy(dtype=bool)] = merchant_labels.get_indexer(
+                _merchant_categories(merchants)
+            )
         
-        print(f"Categorization complete! Categories found: {self.df['Category'].value_counts().to_dict()}")
+        # Other transaction types
+        withdrawal_mask = type_masks['Withdrawal']
+        interest_mask = type_masks['Savings Interest Payment']
+        
+        # Highest priority first. Income is identified by its description, so it
+        # wins even when the export files the paycheck under another type (e.g. Deposits)
+        rules = [
+            (income_mask, 'Income'),
+            (cash_card_mask, merchant_codes),
+            (interest_mask, 'Interest'),
+            (withdrawal_mask, 'Withdrawal'),
+            (p2p_mask, 'P2P Transfer'),
+            (rent_offset_mask, 'Rent Offset (Internal)'),
+            (dca_savings_mask, 'Investment (DCA Savings)'),
+            (deposits_mask, 'Internal Transfer'),
+            (bitcoin_savings_mask, 'Investment (Bitcoin Savings)'),
+            (regular_savings_mask, 'Savings Transfer'),
+            (small_bitcoin_mask, 'Micro-DCA (Bitcoin)'),
+            (bitcoin_mask, 'Investment (Bitcoin)'),
+        ]
+        # Categorical so later groupbys and filters work on integer codes. The rules
+        # select codes into a fixed, sorted label table, so the column is built from
+        # codes instead of hashing a label string per row; labels no row received
+        # are dropped again, matching pd.Categorical of the selected strings
+        labels = pd.Index(sorted(
+            {category for _, category in rules if isinstance(category, str)}
+            | set(merchant_labels) | {'Other'}
+        ))
+        rule_codes = [
+            labels.get_loc(category) if isinstance(category, str)
+            else labels.get_indexer(merchant_labels)[category]
+            for _, category in rules
+        ]
+        codes = np.select(
+            [mask.to_numpy(dtype=bool) for mask, _ in rules],
+            rule_codes,
+            default=labels.get_loc('Other')
+        ).astype(np.int8)
+        self.df['Category'] = pd.Categorical.from_codes(codes, labels).remove_unused_categories()
+        
+        # Keep the Energy Auth match so later filters don't rescan the description text
+        self.df['Is_Energy_Income'] = income_mask.to_numpy(dtype=bool)
     
     def _categorize_cash_card_expense(self, merchant_name):
         """Categorize cash card expenses based on merchant name"""
-        merchant = merchant_name.upper()
-        
-        # Food & Dining
-        food_keywords = [
-            'CHIPOTLE', 'MCDONALD', 'STARBUCKS', 'WAFFLE HOUSE', 'WHATABURGER', 
-            'ZAXBY', 'MARCOS PIZZA', 'JETS PIZZA', 'TROPICAL SMOOTHIE', 'DELI', 
-            'JAX BEACH BRUNCH', 'RESTAURANT', 'QUE ONDA', 'HABERDISH', 'SAKE HOUSE',
-            'CREPE', 'WINN-DIXIE', 'JUICE TAP', 'AKELS DELI', 'ANDREW`S DELI',
-            'PENMAN HOSPITALITY', 'GEMMA FISH OYSTER', 'WORKMAN\'S FRIEND',
-            'FRENCHY\'S SIP', 'SPO*LACOCINAMEXICANARESTA'
-        ]
-        for keyword in food_keywords:
-            if keyword in merchant:
-                return 'Food & Dining'
-        
-        # Entertainment & Media
-        entertainment_keywords = [
-            'NETFLIX', 'SPOTIFY', 'YOUTUBE', 'STEAM', 'ROKU', 'MAX.COM', 'DECCA LIVE',
-            'HOPTINGER', 'SURFER THE BAR', 'BRIX TAPHOUSE', 'STEAMGAMES.COM'
-        ]
-        for keyword in entertainment_keywords:
-            if keyword in merchant:
-                return 'Entertainment & Media'
-        
-        # Gas & Travel
-        travel_keywords = [
-            'LOVE\'S', '7-ELEVEN', 'AMERICAN AIRLINES', 'XPRESS SHOP'
-        ]
-        for keyword in travel_keywords:
-            if keyword in merchant:
-                return 'Gas & Travel'
-        
-        # Healthcare & Fitness
-        health_keywords = [
-            'DENTAL', 'MEDICAL', 'CRUNCH FITNESS', 'WEST BEACHES DENTAL'
-        ]
-        for keyword in health_keywords:
-            if keyword in merchant:
-                return 'Healthcare & Fitness'
-        
-        # Golf & Recreation
-        golf_keywords = [
-            'GOLF', 'MUNICIPAL', 'WHITEWATER', 'HULAWEENTIX', 'CAROLINA LAKES GOL',
-            'ST AUGUSTINE SHORES GC', 'JCKSNVL BCH MUNICPL GL', 'JACKSONVILLE BEACH GOLF',
-            'BLUE SKY GOLF CLUB', 'MARSH LANDING COUNTRY CLU'
-        ]
-        for keyword in golf_keywords:
-            if keyword in merchant:
-                return 'Golf & Recreation'
-        
-        # Subscriptions & Services
-        subscription_keywords = [
-            'APPLE.COM', 'GOOGLE', 'MICROSOFT', 'COMCAST', 'OBSIDIAN', 'KINDLE SVCS',
-            'HELP.MAX.COM', 'CLKBANK*VINCHECKUP', 'THE ROKU CHANNEL'
-        ]
-        for keyword in subscription_keywords:
-            if keyword in merchant:
-                return 'Subscriptions & Services'
-        
-        # Shopping
-        shopping_keywords = [
-            'AMAZON', 'WALGREENS', 'SUNRISE SURF', 'ARGYLE', 'SP FREAK ATHLETE',
-            'SP TITAN FITNESS', 'NNT MENS WEARHOUSE'
-        ]
-        for keyword in shopping_keywords:
-            if keyword in merchant:
-                return 'Shopping'
-        
-        # Transportation
-        transport_keywords = [
-            'CDOT PAY BY CELL'
-        ]
-        for keyword in transport_keywords:
-            if keyword in merchant:
-                return 'Transportation'
-        
-        # Insurance & Financial
-        financial_keywords = [
-            'STATE FARM', 'CAPITAL ONE', 'APPLE CASH SENT MONEY'
-        ]
-        for keyword in financial_keywords:
-            if keyword in merchant:
-                return 'Insurance & Financial'
-        
-        # Housing (Rent/Utilities)
-        housing_keywords = [
-            'YSI*PROGRESS RESIDENTIAL', 'PROGRESS RESIDENTIAL'
-        ]
-        for keyword in housing_keywords:
-            if keyword in merchant:
-                return 'Housing & Rent'
-        
-        # Travel & Tourism
-        tourism_keywords = [
-            'VIATORTRIPADVISOR', 'AIRBNB', 'FGT*HULAWEENTIX'
-        ]
-        for keyword in tourism_keywords:
-            if keyword in merchant:
-                return 'Travel & Tourism'
-        
-        return 'Other Expenses'
+        return _merchant_category(merchant_name.upper())
     
     def set_date_range(self, start_date, end_date):
         """Set custom date range for analysis"""
@@ -381,7 +673,10 @@ class CashAppAnalyzer:
         filtered_df = self.df.loc[mask]
         
         # Group by month and category
-        self.monthly_data = filtered_df.groupby(['Month_Year', 'Category'])['Net_Amount'].sum().unstack(fill_value=0)
+        self.monthly_data = filtered_df.pivot_table(
+            index='Month_Year', columns='Category', values='Net_Amount',
+            aggfunc='sum', fill_value=0, observed=True
+        )
         
         # Calculate monthly totals
         monthly_totals = filtered_df.groupby('Month_Year')['Net_Amount'].agg(['sum', 'count'])
@@ -389,6 +684,37 @@ class CashAppAnalyzer:
         
         return monthly_totals
     
+    def stream_monthly_totals(self, chunksize=200_000):
+        """Monthly totals per transaction type, accumulated chunk by chunk
+        
+        For exports too large to keep in memory: only per-chunk aggregates are
+        held, never the rows. Returns Total_Amount and Transaction_Count indexed
+        by (Month_Year, Transaction Type).
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError("pandas is not available - cannot load CSV data")
+        
+        if not self.csv_file_path:
+            raise ValueError("CSV file path is required")
+        
+        if hasattr(self.csv_file_path, 'seek'):
+            self.csv_file_path.seek(0)
+        
+        if str(self.csv_file_path).lower().endswith('.parquet'):
+            chunks = [pd.read_parquet(self.csv_file_path)]
+        else:
+            chunks = pd.read_csv(self.csv_file_path, dtype=CATEGORICAL_COLUMNS, chunksize=chunksize)
+        
+        partials = [
+            self._clean_frame(chunk)
+            .groupby(['Month_Year', 'Transaction Type'], observed=True)['Net_Amount']
+            .agg(['sum', 'count'])
+            for chunk in chunks
+        ]
+        totals = pd.concat(partials).groupby(level=['Month_Year', 'Transaction Type']).sum()
+        totals.columns = ['Total_Amount', 'Transaction_Count']
+        return totals
+    
     def create_visualizations(self, start_date=None, end_date=None):
         """Create comprehensive visualizations for the report"""
         # Filter data if date range is specified
@@ -427,13 +753,14 @@ class CashAppAnalyzer:
             colors = ['green' if x >= 0 else 'red' for x in monthly_totals.values]
             bars = ax1.bar(range(len(monthly_totals)), monthly_totals.values, color=colors, alpha=0.7)
             ax1.set_xticks(range(len(monthly_totals)))
-            ax1.set_xticklabels([str(m) for m in monthly_totals.index], rotation=45)
+            ax1.set_xticklabels(_month_labels(monthly_totals.index), rotation=45)
             ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
             
-            # Add value labels on bars
+            # Add value labels on bars, offset by 1% of the largest magnitude
+            label_offset = 0.01 * np.abs(monthly_totals.values).max()
             for bar, value in zip(bars, monthly_totals.values):
                 height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + (0.01 * max(abs(monthly_totals.max()), abs(monthly_totals.min()))),
+                ax1.text(bar.get_x() + bar.get_width()/2., height + label_offset,
                         f'${value:,.0f}', ha='center', va='bottom' if height >= 0 else 'top', fontsize=9)
         ax1.set_title('Monthly Net Amount', fontweight='bold')
         ax1.set_xlabel('Month')
@@ -441,7 +768,7 @@ class CashAppAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # 2. Spending Categories (Pie chart)
-        category_totals = df_to_plot.groupby('Category')['Net_Amount'].sum()
+        category_totals = df_to_plot.groupby('Category', observed=True)['Net_Amount'].sum()
         spending_categories = category_totals[category_totals < 0].abs()
         if not spending_categories.empty:
             # Sort by amount for better visualization
@@ -457,14 +784,25 @@ class CashAppAnalyzer:
                     transform=ax2.transAxes, fontsize=12)
         ax2.set_title('Spending by Category', fontweight='bold')
         
+        # Total income and expenses per month in one grouped pass, aligned by
+        # construction; zero amounts are neither, and a month without one of
+        # the flows is left as NaN so the trend charts skip it
+        net_amount = df_to_plot['Net_Amount']
+        nonzero = net_amount.ne(0) & net_amount.notna()
+        sign = np.where(net_amount[nonzero] > 0, 'income', 'expense')
+        monthly_flows = (
+            net_amount[nonzero].groupby([df_to_plot.loc[nonzero, 'Month_Year'], sign]).sum()
+            .unstack().reindex(columns=['income', 'expense'])
+        )
+        
         # 3. Monthly Income Trend
-        monthly_income = df_to_plot[df_to_plot['Net_Amount'] > 0].groupby('Month_Year')['Net_Amount'].sum()
+        monthly_income = monthly_flows['income'].dropna()
         if not monthly_income.empty:
             if len(monthly_income) == 1:
                 # Single data point - use bar chart
                 ax3.bar(range(len(monthly_income)), monthly_income.values, color='green', alpha=0.7, width=0.6)
                 ax3.set_xticks(range(len(monthly_income)))
-                ax3.set_xticklabels([str(m) for m in monthly_income.index])
+                ax3.set_xticklabels(_month_labels(monthly_income.index))
                 # Add value label
                 for i, value in enumerate(monthly_income.values):
                     ax3.text(i, value + (0.01 * value), f'${value:,.0f}', ha='center', va='bottom', fontsize=9)
@@ -473,7 +811,7 @@ class CashAppAnalyzer:
                 ax3.plot(range(len(monthly_income)), monthly_income.values, marker='o', linewidth=2.5, 
                         markersize=8, color='green', alpha=0.8)
                 ax3.set_xticks(range(len(monthly_income)))
-                ax3.set_xticklabels([str(m) for m in monthly_income.index], rotation=45)
+                ax3.set_xticklabels(_month_labels(monthly_income.index), rotation=45)
                 ax3.fill_between(range(len(monthly_income)), monthly_income.values, alpha=0.3, color='green')
         else:
             ax3.text(0.5, 0.5, 'No income data\navailable', ha='center', va='center', 
@@ -484,14 +822,13 @@ class CashAppAnalyzer:
         ax3.grid(True, alpha=0.3)
         
         # 4. Monthly Expenses Trend
-        monthly_expenses = df_to_plot[df_to_plot['Net_Amount'] < 0].groupby('Month_Year')['Net_Amount'].sum()
-        monthly_expenses = monthly_expenses.abs()  # Apply abs() to the Series
+        monthly_expenses = monthly_flows['expense'].dropna().abs()
         if not monthly_expenses.empty:
             if len(monthly_expenses) == 1:
                 # Single data point - use bar chart
                 ax4.bar(range(len(monthly_expenses)), monthly_expenses.values, color='red', alpha=0.7, width=0.6)
                 ax4.set_xticks(range(len(monthly_expenses)))
-                ax4.set_xticklabels([str(m) for m in monthly_expenses.index])
+                ax4.set_xticklabels(_month_labels(monthly_expenses.index))
                 # Add value label
                 for i, value in enumerate(monthly_expenses.values):
                     ax4.text(i, value + (0.01 * value), f'${value:,.0f}', ha='center', va='bottom', fontsize=9)
@@ -500,7 +837,7 @@ class CashAppAnalyzer:
                 ax4.plot(range(len(monthly_expenses)), monthly_expenses.values, marker='o', linewidth=2.5, 
                         markersize=8, color='red', alpha=0.8)
                 ax4.set_xticks(range(len(monthly_expenses)))
-                ax4.set_xticklabels([str(m) for m in monthly_expenses.index], rotation=45)
+                ax4.set_xticklabels(_month_labels(monthly_expenses.index), rotation=45)
                 ax4.fill_between(range(len(monthly_expenses)), monthly_expenses.values, alpha=0.3, color='red')
         else:
             ax4.text(0.5, 0.5, 'No expense data\navailable', ha='center', va='center', 
@@ -511,10 +848,10 @@ class CashAppAnalyzer:
         ax4.grid(True, alpha=0.3)
         
         # 5. Income vs Expenses Comparison
-        all_months = monthly_income.index.union(monthly_expenses.index).sort_values()
+        all_months = monthly_flows.index
         if not all_months.empty:
-            monthly_income_full = monthly_income.reindex(all_months, fill_value=0)
-            monthly_expenses_full = monthly_expenses.reindex(all_months, fill_value=0)
+            monthly_income_full = monthly_flows['income'].fillna(0)
+            monthly_expenses_full = monthly_flows['expense'].fillna(0).abs()
 
             x_pos = np.arange(len(all_months))
             width = 0.35
@@ -525,20 +862,21 @@ class CashAppAnalyzer:
                                   label='Expenses', color='red', alpha=0.7)
             
             ax5.set_xticks(x_pos)
-            ax5.set_xticklabels([str(m) for m in all_months], rotation=45)
+            ax5.set_xticklabels(_month_labels(all_months), rotation=45)
             ax5.legend()
             
-            # Add value labels on bars
+            # Add value labels on bars; the offset is computed once, not per bar
+            label_offset = 0.01 * max(monthly_income_full.max(), monthly_expenses_full.max())
             for bar, value in zip(income_bars, monthly_income_full.values):
                 if value > 0:
                     height = bar.get_height()
-                    ax5.text(bar.get_x() + bar.get_width()/2., height + (0.01 * max(monthly_income_full.max(), monthly_expenses_full.max())),
+                    ax5.text(bar.get_x() + bar.get_width()/2., height + label_offset,
                             f'${value:,.0f}', ha='center', va='bottom', fontsize=8)
             
             for bar, value in zip(expense_bars, monthly_expenses_full.values):
                 if value > 0:
                     height = bar.get_height()
-                    ax5.text(bar.get_x() + bar.get_width()/2., height + (0.01 * max(monthly_income_full.max(), monthly_expenses_full.max())),
+                    ax5.text(bar.get_x() + bar.get_width()/2., height + label_offset,
                             f'${value:,.0f}', ha='center', va='bottom', fontsize=8)
         else:
             ax5.text(0.5, 0.5, 'No data available\nfor comparison', ha='center', va='center', 
@@ -551,6 +889,7 @@ class CashAppAnalyzer:
         
         # 6. Transaction Activity (Count by Category)
         category_counts = df_to_plot['Category'].value_counts()
+        category_counts = category_counts[category_counts > 0]  # drop categories absent from this range
         if not category_counts.empty:
             # Only show top 8 categories to avoid overcrowding
             top_categories = category_counts.head(8)
@@ -561,8 +900,9 @@ class CashAppAnalyzer:
             ax6.invert_yaxis()  # Top category at the top
             
             # Add value labels
+            label_offset = 0.01 * top_categories.max()
             for i, (bar, value) in enumerate(zip(bars, top_categories.values)):
-                ax6.text(value + (0.01 * top_categories.max()), bar.get_y() + bar.get_height()/2,
+                ax6.text(value + label_offset, bar.get_y() + bar.get_height()/2,
                         f'{value}', ha='left', va='center', fontsize=9)
         else:
             ax6.text(0.5, 0.5, 'No transaction data\navailable', ha='center', va='center', 
@@ -573,8 +913,8 @@ class CashAppAnalyzer:
         
         plt.tight_layout()
         plt.subplots_adjust(top=0.93)  # Make room for the main title
-        plt.savefig('cash_app_report.png', dpi=300, bbox_inches='tight')
-        plt.close()  # Close the figure to free memory
+        fig.savefig('cash_app_report.png', dpi=300, bbox_inches='tight')
+        plt.close(fig)  # Close the figure to free memory
         return fig
     
     def generate_report(self, start_date=None, end_date=None):
@@ -617,28 +957,31 @@ class CashAppAnalyzer:
             if not bonus_transactions.empty:
                 report.append("LARGE PAYMENTS & BONUSES (≥$10,000):")
                 report.append("-" * 40)
-                for _, transaction in bonus_transactions.iterrows():
-                    date_str = transaction['Date'].strftime('%Y-%m-%d')
-                    amount = transaction['Net_Amount']
-                    description = transaction['Description']
-                    category = transaction['Category']
+                # Dates are formatted per column; the loop only joins plain values
+                bonus_rows = zip(
+                    bonus_transactions['Date'].dt.strftime('%Y-%m-%d'), bonus_transactions['Net_Amount'],
+                    bonus_transactions['Description'], bonus_transactions['Category']
+                )
+                for date_str, amount, description, category in bonus_rows:
                     report.append(f"{date_str}: ${amount:,.2f} - {description} ({category})")
                 report.append("")
             
             # Monthly breakdown
             report.append("MONTHLY SUMMARY:")
             report.append("-" * 40)
-            monthly_summary = df_to_report.groupby('Month_Year').agg({
-                'Net_Amount': ['sum', 'count'],
-                'Category': lambda x: x.value_counts().index[0] if len(x) > 0 else 'N/A'
-            }).round(2)
+            monthly_summary = df_to_report.groupby('Month_Year')['Net_Amount'].agg(['sum', 'count']).round(2)
+            
+            # Most frequent category per month from one (month, category) count
+            # instead of a value_counts call per month group
+            category_counts = df_to_report.groupby(['Month_Year', 'Category'], observed=True).size()
+            top_categories = category_counts.groupby(level=0).idxmax().map(lambda key: key[1])
             
-            for month in monthly_summary.index:
-                net_amount = monthly_summary.loc[month, ('Net_Amount', 'sum')]
-                transaction_count = monthly_summary.loc[month, ('Net_Amount', 'count')]
-                top_category = monthly_summary.loc[month, ('Category', '<lambda>')]
+            for month, month_label in zip(monthly_summary.index, _month_labels(monthly_summary.index)):
+                net_amount = monthly_summary.at[month, 'sum']
+                transaction_count = monthly_summary.at[month, 'count']
+                top_category = top_categories.get(month, 'N/A')
                 
-                report.append(f"{month}: ${net_amount:,.2f} ({transaction_count} transactions)")
+                report.append(f"{month_label}: ${net_amount:,.2f} ({transaction_count} transactions)")
                 report.append(f"  Top Category: {top_category}")
             
             report.append("")
@@ -673,13 +1016,14 @@ class CashAppAnalyzer:
             ]
             
             if not expense_data.empty:
-                category_spending = expense_data.groupby('Category')['Net_Amount'].sum()
-                category_spending = category_spending.abs().sort_values(ascending=False)
+                # Totals and counts per category in one grouped pass
+                category_stats = expense_data.groupby('Category', observed=True)['Net_Amount'].agg(['sum', 'size'])
+                category_spending = category_stats['sum'].abs().sort_values(ascending=False)
                 total_spending = category_spending.sum()
                 
                 for category, amount in category_spending.items():
                     percentage = (amount / total_spending) * 100
-                    transaction_count = len(expense_data[expense_data['Category'] == category])
+                    transaction_count = category_stats.at[category, 'size']
                     avg_amount = amount / transaction_count if transaction_count > 0 else 0
                     report.append(f"{category}: ${amount:,.2f} ({percentage:.1f}%) - {transaction_count} transactions, avg ${avg_amount:.2f}")
             else:
@@ -691,13 +1035,13 @@ class CashAppAnalyzer:
             if not investment_data.empty:
                 report.append("INVESTMENTS:")
                 report.append("-" * 40)
-                investment_summary = investment_data.groupby('Category')['Net_Amount'].sum()
-                investment_summary = investment_summary.abs().sort_values(ascending=False)
+                investment_stats = investment_data.groupby('Category', observed=True)['Net_Amount'].agg(['sum', 'size'])
+                investment_summary = investment_stats['sum'].abs().sort_values(ascending=False)
                 total_investments = investment_summary.sum()
                 
                 for category, amount in investment_summary.items():
                     percentage = (amount / total_investments) * 100 if total_investments > 0 else 0
-                    transaction_count = len(investment_data[investment_data['Category'] == category])
+                    transaction_count = investment_stats.at[category, 'size']
                     avg_amount = amount / transaction_count if transaction_count > 0 else 0
                     report.append(f"{category}: ${amount:,.2f} ({percentage:.1f}%) - {transaction_count} transactions, avg ${avg_amount:.2f}")
                 
@@ -709,9 +1053,10 @@ class CashAppAnalyzer:
             if not internal_data.empty:
                 report.append("INTERNAL TRANSFERS (excluded from income/expense totals):")
                 report.append("-" * 40)
-                internal_summary = internal_data.groupby('Category')['Net_Amount'].sum().sort_values(ascending=False)
+                internal_stats = internal_data.groupby('Category', observed=True)['Net_Amount'].agg(['sum', 'size'])
+                internal_summary = internal_stats['sum'].sort_values(ascending=False)
                 for category, amount in internal_summary.items():
-                    transaction_count = len(internal_data[internal_data['Category'] == category])
+                    transaction_count = internal_stats.at[category, 'size']
                     report.append(f"{category}: ${amount:,.2f} - {transaction_count} transactions")
                 report.append("")
             
@@ -739,8 +1084,9 @@ class CashAppAnalyzer:
                 report.append(f"Total Savings Rate (cash + investments): {total_savings_rate:.1f}%")
             
             # Category with most transactions
-            most_frequent_category = df_to_report['Category'].value_counts().index[0]
-            most_frequent_count = df_to_report['Category'].value_counts().iloc[0]
+            category_frequency = df_to_report['Category'].value_counts()
+            most_frequent_category = category_frequency.index[0]
+            most_frequent_count = category_frequency.iloc[0]
             report.append(f"Most Frequent Category: {most_frequent_category} ({most_frequent_count} transactions)")
             
             # Largest single transaction
@@ -760,11 +1106,11 @@ class CashAppAnalyzer:
             if not all_transaction_data.empty:
                 # Sort by absolute amount (largest first)
                 top_5_transactions = all_transaction_data.loc[all_transaction_data['Net_Amount'].abs().nlargest(5).index]
-                for i, (_, transaction) in enumerate(top_5_transactions.iterrows(), 1):
-                    date_str = transaction['Date'].strftime('%Y-%m-%d')
-                    amount = transaction['Net_Amount']
-                    description = transaction['Description']
-                    category = transaction['Category']
+                top_rows = zip(
+                    top_5_transactions['Date'].dt.strftime('%Y-%m-%d'), top_5_transactions['Net_Amount'],
+                    top_5_transactions['Description'], top_5_transactions['Category']
+                )
+                for i, (date_str, amount, description, category) in enumerate(top_rows, 1):
                     sign = "+" if amount >= 0 else "-"
                     report.append(f"{i}. {date_str}: {sign}${abs(amount):,.2f} - {description} ({category})")
             else:
@@ -945,7 +1291,7 @@ class CashAppAnalyzer:
         ax1.set_ylabel('Expenses ($)')
         
         # 2. Expenses by Category
-        expense_categories = expense_df.groupby('Category')['Net_Amount'].sum()
+        expense_categories = expense_df.groupby('Category', observed=True)['Net_Amount'].sum()
         if not expense_categories.empty:
             expense_categories = expense_categories.sort_values(ascending=False)
             colors = plt.cm.Reds(np.linspace(0.4, 0.9, len(expense_categories)))
@@ -961,6 +1307,7 @@ class CashAppAnalyzer:
         
         # 3. Expense Transaction Count by Category
         expense_counts = expense_df['Category'].value_counts()
+        expense_counts = expense_counts[expense_counts > 0]  # drop non-expense categories
         if not expense_counts.empty:
             colors = plt.cm.Reds(np.linspace(0.4, 0.9, len(expense_counts)))
             bars = ax3.barh(range(len(expense_counts)), expense_counts.values, color=colors, alpha=0.8)
@@ -968,8 +1315,9 @@ class CashAppAnalyzer:
             ax3.set_yticklabels(expense_counts.index)
             ax3.invert_yaxis()
             
+            label_offset = 0.01 * expense_counts.max()
             for i, (bar, value) in enumerate(zip(bars, expense_counts.values)):
-                ax3.text(value + (0.01 * expense_counts.max()), bar.get_y() + bar.get_height()/2,
+                ax3.text(value + label_offset, bar.get_y() + bar.get_height()/2,
                         f'{value}', ha='left', va='center', fontsize=9)
         else:
             ax3.text(0.5, 0.5, 'No expense transaction\ndata available', ha='center', va='center', 
@@ -987,8 +1335,9 @@ class CashAppAnalyzer:
             ax4.set_yticklabels(top_spending.index)
             ax4.invert_yaxis()
             
+            label_offset = 0.01 * top_spending.max()
             for i, value in enumerate(top_spending.values):
-                ax4.text(value + (0.01 * top_spending.max()), i,
+                ax4.text(value + label_offset, i,
                         f'${value:,.0f}', ha='left', va='center', fontsize=9)
         else:
             ax4.text(0.5, 0.5, 'No expense data\navailable', ha='center', va='center', 
@@ -1054,34 +1403,37 @@ class CashAppAnalyzer:
         ]
         
         # Calculate monthly data
-        income_data = df_to_plot[
-            (df_to_plot['Net_Amount'] > 0) & 
-            (~df_to_plot['Category'].isin(internal_categories)) &
-            (~df_to_plot['Category'].isin(investment_categories))
-        ]
-        expense_data = df_to_plot[
-            (df_to_plot['Net_Amount'] < 0) & 
-            (~df_to_plot['Category'].isin(internal_categories)) &
-            (~df_to_plot['Category'].isin(investment_categories))
-        ]
-        investment_data = df_to_plot[
-            (df_to_plot['Net_Amount'] < 0) &  # Investments are outflows (negative amounts)
-            (df_to_plot['Category'].isin(investment_categories))
-        ]
-        
-        monthly_income = income_data.groupby('Month_Year')['Net_Amount'].sum()
-        monthly_expenses = expense_data.groupby('Month_Year')['Net_Amount'].sum().abs()
-        monthly_investments = investment_data.groupby('Month_Year')['Net_Amount'].sum().abs()
+        is_internal = df_to_plot['Category'].isin(internal_categories)
+        is_investment = df_to_plot['Category'].isin(investment_categories)
+        income_mask = (df_to_plot['Net_Amount'] > 0) & ~is_internal & ~is_investment
+        expense_mask = (df_to_plot['Net_Amount'] < 0) & ~is_internal & ~is_investment
+        investment_mask = (df_to_plot['Net_Amount'] < 0) & is_investment  # Investments are outflows (negative amounts)
+        income_data = df_to_plot[income_mask]
+        expense_data = df_to_plot[expense_mask]
+        investment_data = df_to_plot[investment_mask]
+        
+        # Label each row's flow once and total every flow per month in a single pivot
+        flow = np.select(
+            [income_mask.to_numpy(), expense_mask.to_numpy(), investment_mask.to_numpy()],
+            ['income', 'expense', 'investment'],
+            default=''
+        )
+        has_flow = flow != ''
+        flows = df_to_plot.loc[has_flow, ['Month_Year', 'Net_Amount']].assign(Flow=flow[has_flow])
+        monthly_flows = flows.pivot_table(
+            index='Month_Year', columns='Flow', values='Net_Amount', aggfunc='sum', fill_value=0
+        ).reindex(columns=['income', 'expense', 'investment'], fill_value=0)
         
         # Get all months that have any transactions
-        all_months = pd.concat([income_data, expense_data, investment_data]).groupby('Month_Year')['Net_Amount'].count().index
+        all_months = monthly_flows.index
         if len(all_months) == 0:
             # If no transactions, use all months from data
             all_months = df_to_plot.groupby('Month_Year')['Net_Amount'].count().index
         
-        monthly_income = monthly_income.reindex(all_months, fill_value=0)
-        monthly_expenses = monthly_expenses.reindex(all_months, fill_value=0)
-        monthly_investments = monthly_investments.reindex(all_months, fill_value=0)
+        monthly_flows = monthly_flows.reindex(all_months, fill_value=0)
+        monthly_income = monthly_flows['income']
+        monthly_expenses = monthly_flows['expense'].abs()
+        monthly_investments = monthly_flows['investment'].abs()
         monthly_net_flow = monthly_income - monthly_expenses - monthly_investments
         
         # 1. Monthly Cash Flow Trend
@@ -1090,7 +1442,7 @@ class CashAppAnalyzer:
             colors = ['green' if x >= 0 else 'red' for x in monthly_net_flow.values]
             bars = ax1.bar(x_pos, monthly_net_flow.values, color=colors, alpha=0.7)
             ax1.set_xticks(x_pos)
-            ax1.set_xticklabels([str(m) for m in monthly_net_flow.index], rotation=45)
+            ax1.set_xticklabels(_month_labels(monthly_net_flow.index), rotation=45)
             ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
             
             # Add value labels on bars
@@ -1123,7 +1475,7 @@ class CashAppAnalyzer:
                            width, label='Investments', color='blue', alpha=0.7)
             
             ax2.set_xticks(x_pos)
-            ax2.set_xticklabels([str(m) for m in all_months], rotation=45)
+            ax2.set_xticklabels(_month_labels(all_months), rotation=45)
             ax2.legend()
             
             # Add value labels
@@ -1191,7 +1543,7 @@ class CashAppAnalyzer:
         # 4. Investment Breakdown by Category
         if not investment_data.empty:
             # Group investments by category
-            investment_totals = investment_data.groupby('Category')['Net_Amount'].sum().abs()
+            investment_totals = investment_data.groupby('Category', observed=True)['Net_Amount'].sum().abs()
             
             if not investment_totals.empty:
                 # Create pie chart of investment allocation
@@ -1226,13 +1578,18 @@ class CashAppAnalyzer:
         plt.subplots_adjust(top=0.93)
         return fig
     
-    def generate_pdf_report(self, output_path=None, month_offset=1):
+    def generate_pdf_report(self, output_path=None, month_offset=1, force=False):
         """
         Generate a PDF report for the specified month (default: prior month)
         
+        Reports are cached by a hash of the month's data, so an unchanged month is
+        copied from the cache instead of rebuilt. Set CASHAPP_PDF_NO_CACHE=1 to
+        bypass the cache entirely.
+        
         Args:
             output_path (str): Path where PDF should be saved. If None, uses temp dir.
             month_offset (int): Number of months back from current month (1 = prior month)
+            force (bool): Rebuild the PDF even if a cached copy exists
         
         Returns:
             str: Path to generated PDF file
@@ -1291,8 +1648,22 @@ class CashAppAnalyzer:
                 f"cash_app_report_{start_date.strftime('%Y_%m')}.pdf"
             )
         
+        # Reuse a previously built report when the month's data and the report version are unchanged
+        use_cache = os.environ.get('CASHAPP_PDF_NO_CACHE') != '1'
+        digest = _frame_digest(month_data, report_title, PDF_CACHE_VERSION)
+        cache_path = os.path.join(PDF_CACHE_DIR, f"{digest}.pdf")
+        if use_cache and not force and os.path.exists(cache_path):
+            try:
+                shutil.copyfile(cache_path, output_path)
+                os.utime(cache_path)  # Mark as recently used for pruning
+                print(f"PDF report reused from cache: {output_path}")
+                return output_path
+            except OSError:
+                pass  # Entry pruned or unreadable; build the report instead
+        
         # Create PDF document
         doc = SimpleDocTemplate(output_path, pagesize=letter)
+        chart_path = None
         story = []
         styles = getSampleStyleSheet()
         
@@ -1317,9 +1688,13 @@ class CashAppAnalyzer:
         story.append(Paragraph(report_title, title_style))
         story.append(Spacer(1, 12))
         
+        # Absolute amounts and the outflow mask are shared by every section below
+        month_data['abs_amount'] = month_data['Net_Amount'].abs()
+        is_expense = month_data['Net_Amount'].lt(0)
+        
         # Executive Summary - Define data splits first
         income_data = month_data[month_data['Net_Amount'] > 0]
-        expense_data = month_data[month_data['Net_Amount'] < 0]
+        expense_data = month_data[is_expense]
         
         # Define investment categories for PDF analysis
         investment_categories = [
@@ -1327,21 +1702,19 @@ class CashAppAnalyzer:
         ]
         
         # Separate investment data from expense data
-        investment_data = month_data[
-            (month_data['Net_Amount'] < 0) &
-            (month_data['Category'].isin(investment_categories))
-        ]
+        is_investment = month_data['Category'].isin(investment_categories)
+        investment_data = month_data[is_expense & is_investment]
         
         # Recalculate expenses excluding investments
-        expense_data = month_data[
-            (month_data['Net_Amount'] < 0) &
-            (~month_data['Category'].isin(investment_categories))
-        ]
+        expense_data = month_data[is_expense & ~is_investment]
         
         total_income = income_data['Net_Amount'].sum()
         total_expenses = expense_data['Net_Amount'].sum()
-        total_investments = abs(investment_data['Net_Amount'].sum()) if not investment_data.empty else 0
+        total_investments = investment_data['abs_amount'].sum() if not investment_data.empty else 0
         net_cash_flow = total_income + total_expenses  # total_expenses is negative, investments excluded
+        
+        # Per-category expense totals, shared by the breakdown table, the insights and both charts
+        expense_totals = expense_data.groupby('Category', observed=True)['Net_Amount'].sum()
         transaction_count = len(month_data)
         
         summary_text = f"""
@@ -1370,7 +1743,7 @@ class CashAppAnalyzer:
         
         # Expense categories
         if not expense_data.empty:
-            expense_by_category = expense_data.groupby('Category')['Net_Amount'].sum().sort_values(ascending=False)
+            expense_by_category = expense_totals.sort_values(ascending=False)
             total_expenses = expense_by_category.sum()
             
             expense_table_data = [['Expense Category', 'Amount', 'Percentage']]
@@ -1401,16 +1774,22 @@ class CashAppAnalyzer:
         story.append(Paragraph("Notable Transactions", heading_style))
         
         # Top 10 largest transactions (by absolute value)
-        month_data['abs_amount'] = month_data['Net_Amount'].abs()
         top_transactions = month_data.nlargest(10, 'abs_amount')
         
         trans_table_data = [['Date', 'Description', 'Category', 'Amount']]
-        for _, row in top_transactions.iterrows():
+        # Columns are resolved once and zipped rather than looked up per row
+        desc_col = next((col for col in ('Description', 'Notes') if col in top_transactions.columns), None)
+        descriptions = top_transactions[desc_col].map(str) if desc_col else [''] * len(top_transactions)
+        top_rows = zip(
+            top_transactions['Date'].dt.strftime('%m/%d/%Y'), descriptions,
+            top_transactions['Category'], top_transactions['Net_Amount']
+        )
+        for date_str, description, category, amount in top_rows:
             trans_table_data.append([
-                row['Date'].strftime('%m/%d/%Y'),
-                str(row.get('Description', row.get('Notes', '')))[:40] + ('...' if len(str(row.get('Description', row.get('Notes', '')))) > 40 else ''),
-                row['Category'],
-                f"${row['Net_Amount']:,.2f}"
+                date_str,
+                description[:40] + ('...' if len(description) > 40 else ''),
+                category,
+                f"${amount:,.2f}"
             ])
         
         trans_table = Table(trans_table_data)
@@ -1439,7 +1818,7 @@ class CashAppAnalyzer:
         top_expense_category = "N/A"
         top_expense_amount = 0
         if not expense_data.empty:
-            expense_by_cat = expense_data.groupby('Category')['Net_Amount'].sum()
+            expense_by_cat = expense_totals
             top_expense_category = expense_by_cat.abs().idxmax()
             top_expense_amount = abs(expense_by_cat.min())
         
@@ -1503,7 +1882,7 @@ class CashAppAnalyzer:
                 
                 # Chart 2: Expense Categories Pie Chart
                 if not expense_data.empty:
-                    expense_by_category = expense_data.groupby('Category')['Net_Amount'].sum().abs()
+                    expense_by_category = expense_totals.abs()
                     if len(expense_by_category) > 0:
                         # Only show top 6 categories, group others
                         if len(expense_by_category) > 6:
@@ -1531,7 +1910,7 @@ class CashAppAnalyzer:
                 
                 # Chart 3: Daily Spending Trend
                 if not month_data.empty:
-                    daily_expenses = month_data[month_data['Net_Amount'] < 0].groupby(month_data['Date'].dt.date)['Net_Amount'].sum().abs()
+                    daily_expenses = month_data[is_expense].groupby(month_data['Date'].dt.date)['abs_amount'].sum()
                     if len(daily_expenses) > 0:
                         ax3.plot(daily_expenses.index, daily_expenses.values, marker='o', linewidth=2, markersize=4)
                         ax3.set_title('Daily Spending Trend', fontweight='bold')
@@ -1560,14 +1939,13 @@ class CashAppAnalyzer:
                 # Chart 4: Top Merchants/Categories
                 if not expense_data.empty:
                     # Calculate expense by category for fallback use
-                    expense_by_category = expense_data.groupby('Category')['Net_Amount'].sum().abs()
+                    expense_by_category = expense_totals.abs()
                     
                     # Try to get merchant data from Description/Notes or use categories
                     if 'Description' in month_data.columns or 'Notes' in month_data.columns:
                         # Get top merchants from Cash Card transactions if Transaction Type exists
                         if 'Transaction Type' in month_data.columns:
-                            cash_card_data = month_data[(month_data['Transaction Type'] == 'Cash Card') & 
-                                                       (month_data['Net_Amount'] < 0)]
+                            cash_card_data = month_data[(month_data['Transaction Type'] == 'Cash Card') & is_expense]
                         else:
                             # If no Transaction Type, use all expense data
                             cash_card_data = expense_data
@@ -1630,19 +2008,27 @@ class CashAppAnalyzer:
                 fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
                 plt.close(fig)
                 
-                # Add chart to PDF
+                # Add chart to PDF; the image is read when the document is built
                 story.append(Image(chart_path, width=7.5*inch, height=6*inch))
                 
-                # Clean up temp file
-                if os.path.exists(chart_path):
-                    os.remove(chart_path)
-                
             except Exception as e:
                 # If visualization fails, add a note
                 story.append(Paragraph(f"Note: Chart generation unavailable ({str(e)})", styles['Italic']))
         
-        # Build PDF
-        doc.build(story)
+        # Build PDF, then clean up the temporary chart image
+        try:
+            doc.build(story)
+        finally:
+            if chart_path and os.path.exists(chart_path):
+                os.remove(chart_path)
+        
+        if use_cache:
+            try:
+                _ensure_private_dir(PDF_CACHE_DIR)
+                _atomic_write(cache_path, lambda temp_path: shutil.copyfile(output_path, temp_path))
+                _prune_cache(PDF_CACHE_DIR, '.pdf', PDF_CACHE_MAX_ENTRIES)
+            except OSError:
+                pass  # Caching is best effort; the report itself was written
         
         print(f"PDF report generated successfully: {output_path}")
         return output_path
@@ -1739,9 +2125,10 @@ class CashAppAnalyzer:
         fig.suptitle(title, fontsize=16, fontweight='bold', y=0.98)
         
         # 1. Top 5 Expense Categories (Bar Chart)
-        expense_categories = expense_df.groupby('Category')['Net_Amount'].sum()
+        # Ranked once; the bar chart and the pie chart both slice this ordering
+        expense_categories = expense_df.groupby('Category', observed=True)['Net_Amount'].sum().sort_values(ascending=False)
         if not expense_categories.empty:
-            top_5_categories = expense_categories.sort_values(ascending=False).head(5)
+            top_5_categories = expense_categories.head(5)
             colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']  # Nice color palette
             
             bars = ax1.barh(range(len(top_5_categories)), top_5_categories.values, 
@@ -1751,8 +2138,9 @@ class CashAppAnalyzer:
             ax1.invert_yaxis()  # Top category at the top
             
             # Add value labels on bars
+            label_offset = 0.02 * top_5_categories.max()
             for i, (bar, value) in enumerate(zip(bars, top_5_categories.values)):
-                ax1.text(value + (0.02 * top_5_categories.max()), bar.get_y() + bar.get_height()/2,
+                ax1.text(value + label_offset, bar.get_y() + bar.get_height()/2,
                         f'${value:,.0f}', ha='left', va='center', fontsize=10, fontweight='bold')
         else:
             ax1.text(0.5, 0.5, 'No expense data\navailable', ha='center', va='center', 
@@ -1767,11 +2155,12 @@ class CashAppAnalyzer:
             
             # Create labels for transactions (truncate long descriptions)
             labels = []
-            for _, row in top_5_transactions.iterrows():
-                desc = str(row.get('Description', row.get('Notes', 'Unknown')))
+            desc_col = next((col for col in ('Description', 'Notes') if col in top_5_transactions.columns), None)
+            descriptions = top_5_transactions[desc_col].map(str) if desc_col else ['Unknown'] * len(top_5_transactions)
+            for desc, category in zip(descriptions, top_5_transactions['Category']):
                 if len(desc) > 20:
                     desc = desc[:17] + '...'
-                labels.append(f"{desc}\n({row['Category']})")
+                labels.append(f"{desc}\n({category})")
             
             bars = ax2.bar(range(len(top_5_transactions)), top_5_transactions['Net_Amount'].values, 
                           color='lightcoral', alpha=0.8)
@@ -1801,11 +2190,11 @@ class CashAppAnalyzer:
                         linewidth=3, markersize=8, color='#FF6B6B', alpha=0.8)
                 ax3.fill_between(range(len(monthly_trend)), monthly_trend.values, alpha=0.3, color='#FF6B6B')
                 ax3.set_xticks(range(len(monthly_trend)))
-                ax3.set_xticklabels([str(m) for m in monthly_trend.index], rotation=45)
+                ax3.set_xticklabels(_month_labels(monthly_trend.index), rotation=45)
             elif len(monthly_trend) == 1:
                 ax3.bar(range(len(monthly_trend)), monthly_trend.values, color='#FF6B6B', alpha=0.8, width=0.6)
                 ax3.set_xticks(range(len(monthly_trend)))
-                ax3.set_xticklabels([str(m) for m in monthly_trend.index])
+                ax3.set_xticklabels(_month_labels(monthly_trend.index))
             else:
                 ax3.text(0.5, 0.5, f'No data for\n{top_category}', ha='center', va='center', 
                         transform=ax3.transAxes, fontsize=12)
@@ -1821,12 +2210,12 @@ class CashAppAnalyzer:
         # 4. Expense Distribution Pie Chart (Top 5 + Others)
         if not expense_categories.empty:
             if len(expense_categories) > 5:
-                top_4_categories = expense_categories.sort_values(ascending=False).head(4)
-                others_sum = expense_categories.sort_values(ascending=False).iloc[4:].sum()
+                top_4_categories = expense_categories.head(4)
+                others_sum = expense_categories.iloc[4:].sum()
                 plot_data = top_4_categories.copy()
                 plot_data['Others'] = others_sum
             else:
-                plot_data = expense_categories.sort_values(ascending=False)
+                plot_data = expense_categories
             
             colors_pie = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
             wedges, texts, autotexts = ax4.pie(plot_data.values, labels=plot_data.index, 
@@ -258,7 +258,7 @@ class PDFGenerator:
         
         expense_data = month_data[month_data['Net_Amount'] < 0]
         if not expense_data.empty:
-            expense_by_category = expense_data.groupby('Category')['Net_Amount'].sum().sort_values(ascending=False)
+            expense_by_category = expense_data.groupby('Category', observed=True)['Net_Amount'].sum().sort_values(ascending=False)
             total_expenses = expense_by_category.sum()
             
             expense_table_data = [['Expense Category', 'Amount', 'Percentage']]
@@ -387,7 +387,7 @@ class PDFGenerator:
         story.append(Paragraph("Investment Summary", heading_style))
         investment_data = month_data[(month_data['Net_Amount'] < 0) & month_data['Category'].str.contains('Investment')]
         if not investment_data.empty:
-            inv_summary = investment_data.groupby('Category')['Net_Amount'].sum().abs()
+            inv_summary = investment_data.groupby('Category', observed=True)['Net_Amount'].sum().abs()
             inv_table_data = [['Category', 'Amount']]
             for cat, amt in inv_summary.items():
                 inv_table_data.append([cat, f"${amt:,.2f}"])
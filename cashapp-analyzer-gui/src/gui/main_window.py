@@ -752,42 +752,39 @@ class MainWindow:
         # Sort by date (most recent first)
         df_sorted = df.sort_values('Date', ascending=False)
         
+        # Format dates per column; missing dates show as N/A
+        date_strs = df_sorted['Date'].dt.strftime('%Y-%m-%d').fillna('N/A')
+        month_strs = df_sorted['Date'].dt.strftime('%Y-%m').fillna('N/A')
+        
+        # Use safe access to Description column
+        if 'Description' in df_sorted.columns:
+            descriptions = df_sorted['Description'].map(str)
+        elif 'Notes' in df_sorted.columns:
+            descriptions = df_sorted['Notes'].map(str)
+        else:
+            descriptions = pd.Series('N/A', index=df_sorted.index)
+        
         # Add data to tree
-        for _, row in df_sorted.iterrows():
-            # Format amount with color coding
-            amount = f"${row['Net_Amount']:,.2f}"
-            
-            # Format date
-            date_str = row['Date'].strftime('%Y-%m-%d') if pd.notna(row['Date']) else 'N/A'
-            
-            # Insert row
-            # Use safe access to Description column
-            description_text = ''
-            if 'Description' in df_sorted.columns:
-                description_text = str(row['Description'])
-            elif 'Notes' in df_sorted.columns:
-                description_text = str(row['Notes'])
+        tree_rows = zip(date_strs, descriptions, df_sorted['Net_Amount'], df_sorted['Category'], month_strs)
+        for date_str, description_text, net_amount, category, month_str in tree_rows:
+            # Format amount with its sign in front of the dollar sign
+            # Note: color coding via Treeview styling would require additional configuration
+            if net_amount < 0:
+                amount = f"-${abs(net_amount):,.2f}"
             else:
-                description_text = 'N/A'
+                amount = f"${net_amount:,.2f}"
             
             # Truncate description if too long
             if len(description_text) > 50:
                 description_text = description_text[:50] + '...'
             
-            item = self.data_tree.insert('', 'end', values=(
+            self.data_tree.insert('', 'end', values=(
                 date_str,
                 description_text,
                 amount,
-                row['Category'],
-                row['Month_Year']
+                category,
+                month_str
             ))
-            
-            # Color code based on amount
-            if row['Net_Amount'] < 0:
-                self.data_tree.set(item, 'Amount', f"-${abs(row['Net_Amount']):,.2f}")
-                # Note: Treeview styling would require additional configuration
-            else:
-                self.data_tree.set(item, 'Amount', f"${row['Net_Amount']:,.2f}")
         
         # Update count
         self.data_count_var.set(f"Showing {len(df_sorted)} transactions")
@@ -0,0 +1,126 @@
+"""
+Shared pytest configuration for the whole test suite
+
+Selects the non-interactive Agg backend and pays the one-time matplotlib font
+cache and reportlab import costs when each (xdist worker) session is
+configured, before any test or benchmark round is measured. Also provides a
+hidden Tk root and a reusable chart figure that tests share instead of
+creating their own.
+
+Tests marked ``slow`` (full-export and PDF-building checks) are skipped unless
+pytest is run with ``--runslow``. The analyzer's PDF and cleaned-CSV caches are
+pointed at a temporary directory for the whole session, so test runs never
+write into the user's real cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+# matplotlib is optional here; tests that need it skip through their own guards
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="Also run tests marked slow"
+    )
+
+
+# pytest.ini uses a [tool:pytest] section, which pytest does not read, so the
+# suite's markers are registered here
+MARKERS = (
+    "unit: Unit tests",
+    "integration: Integration tests",
+    "slow: Slow running tests",
+    "pdf: Tests requiring PDF generation",
+    "viz: Tests requiring visualization capabilities",
+    "serial: Tk/GUI tests that must run in a single process",
+)
+
+
+def pytest_configure(config):
+    """Register markers and warm shared caches once per process"""
+    for marker in MARKERS:
+        config.addinivalue_line("markers", marker)
+    
+    # Build the font cache and initialize Agg before any test builds a real figure
+    if plt is not None:
+        plt.figure().clear()
+        plt.close('all')
+    
+    try:
+        import reportlab.platypus  # noqa: F401
+        from reportlab.lib.styles import getSampleStyleSheet
+        getSampleStyleSheet()
+    except ImportError:
+        pass
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow was given"""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_analyzer_caches(tmp_path_factory):
+    """Redirect the analyzer's on-disk caches to a session temp directory"""
+    cache_root = tmp_path_factory.mktemp('analyzer_cache')
+    patcher = pytest.MonkeyPatch()
+    # Modules imported later, and subprocesses, resolve their cache dirs from these
+    patcher.setenv('XDG_CACHE_HOME', str(cache_root))
+    patcher.setenv('LOCALAPPDATA', str(cache_root))
+    # The analyzer may already be imported (under either name) by collected test modules
+    for name in ('analyzer.cashapp_analyzer', 'src.analyzer.cashapp_analyzer'):
+        module = sys.modules.get(name)
+        if module is not None:
+            patcher.setattr(module, 'CLEANED_CACHE_DIR', module._user_cache_dir('csv'))
+            patcher.setattr(module, 'PDF_CACHE_DIR', module._user_cache_dir('pdf'))
+    yield cache_root
+    patcher.undo()
+
+
+@pytest.fixture(scope="session")
+def _shared_2x2_fig():
+    if plt is None:
+        pytest.skip("matplotlib not available")
+    fig, _ = plt.subplots(2, 2, figsize=(12, 10))
+    yield fig
+    plt.close(fig)
+
+
+@pytest.fixture
+def blank_2x2_fig(_shared_2x2_fig):
+    """Session-wide 2x2 chart figure, cleared after each test instead of rebuilt"""
+    yield _shared_2x2_fig
+    for ax in _shared_2x2_fig.axes:
+        ax.cla()
+    _shared_2x2_fig.suptitle('')
+
+
+@pytest.fixture(scope="module")
+def tk_root():
+    """Hidden Tk root shared by all GUI tests in a module"""
+    # Imported here so suites on Python builds without Tk still collect
+    tk = pytest.importorskip("tkinter")
+    if os.environ.get("DISPLAY") is None and sys.platform not in ("win32", "darwin"):
+        pytest.skip("No display available for Tk")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk display not available: {e}")
+    root.withdraw()
+    yield root
+    root.destroy()
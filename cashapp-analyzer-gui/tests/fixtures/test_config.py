@@ -5,8 +5,10 @@ This module provides common test fixtures, sample data, and configuration
 for use across all test modules.
 """
 
+import io
 import os
 import tempfile
+import importlib.util
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -16,6 +18,12 @@ class TestConfig:
     
     # Test data paths
     SAMPLE_CSV_PATH = os.path.join(os.path.dirname(__file__), 'sample_data.csv')
+    SAMPLE_PARQUET_PATH = os.path.join(os.path.dirname(__file__), 'sample_data.parquet')
+    
+    # Parquet needs an engine (pyarrow or fastparquet); tests fall back to CSV without one
+    PARQUET_AVAILABLE = any(
+        importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet')
+    )
     
     # Test output directory
     TEST_OUTPUT_DIR = tempfile.mkdtemp(prefix='cashapp_test_')
@@ -56,11 +64,29 @@ class TestConfig:
         return pd.DataFrame(sample_data)
     
     @classmethod
-    def create_sample_csv(cls):
-        """Create a sample CSV file for testing"""
+    def create_sample_csv(cls, path=None):
+        """Create a sample CSV file for testing, at path or SAMPLE_CSV_PATH"""
+        path = str(path or cls.SAMPLE_CSV_PATH)
+        df = cls.get_sample_data()
+        df.to_csv(path, index=False)
+        return path
+    
+    @classmethod
+    def create_sample_buffer(cls):
+        """Create the sample CSV in memory for tests that don't need a file on disk"""
+        buffer = io.BytesIO()
+        cls.get_sample_data().to_csv(buffer, index=False)
+        buffer.seek(0)
+        return buffer
+    
+    @classmethod
+    def create_sample_parquet(cls, path=None):
+        """Create a typed Parquet copy of the sample data, at path or SAMPLE_PARQUET_PATH"""
+        path = str(path or cls.SAMPLE_PARQUET_PATH)
         df = cls.get_sample_data()
-        df.to_csv(cls.SAMPLE_CSV_PATH, index=False)
-        return cls.SAMPLE_CSV_PATH
+        df['Date'] = pd.to_datetime(df['Date'])
+        df.to_parquet(path, compression='snappy', index=False)
+        return path
     
     @classmethod
     def cleanup(cls):
@@ -68,8 +94,9 @@ class TestConfig:
         import shutil
         if os.path.exists(cls.TEST_OUTPUT_DIR):
             shutil.rmtree(cls.TEST_OUTPUT_DIR)
-        if os.path.exists(cls.SAMPLE_CSV_PATH):
-            os.remove(cls.SAMPLE_CSV_PATH)
+        for path in (cls.SAMPLE_CSV_PATH, cls.SAMPLE_PARQUET_PATH):
+            if os.path.exists(path):
+                os.remove(path)
 
 
 def pytest_configure(config):
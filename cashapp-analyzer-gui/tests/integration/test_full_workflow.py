@@ -10,6 +10,8 @@ import pandas as pd
 import sys
 import os
 import tempfile
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # Add src to path
@@ -22,6 +24,13 @@ except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure the src directory is properly structured")
 
+# Optional dependencies are resolved once at import time
+HAS_REPORTLAB = importlib.util.find_spec("reportlab") is not None
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+if HAS_MATPLOTLIB:
+    import matplotlib.pyplot as plt
+
 
 class TestFullWorkflow(unittest.TestCase):
     """Test complete analyzer workflows"""
@@ -59,6 +68,7 @@ class TestFullWorkflow(unittest.TestCase):
         # Verify visualization is created
         self.assertIsNotNone(fig)
     
+    @unittest.skipUnless(HAS_REPORTLAB, "ReportLab not available for PDF generation")
     def test_pdf_generation_workflow(self):
         """Test PDF report generation"""
         analyzer = CashAppAnalyzer(self.sample_csv_path)
@@ -67,18 +77,13 @@ class TestFullWorkflow(unittest.TestCase):
         
         # Generate PDF report
         pdf_path = os.path.join(self.output_dir, 'test_report.pdf')
+        result_path = analyzer.generate_pdf_report(pdf_path)
         
-        try:
-            result_path = analyzer.generate_pdf_report(pdf_path)
-            
-            # Verify PDF was created
-            self.assertTrue(os.path.exists(result_path))
-            self.assertGreater(os.path.getsize(result_path), 0)
-            
-        except ImportError:
-            # Skip test if ReportLab not available
-            self.skipTest("ReportLab not available for PDF generation")
+        # Verify PDF was created
+        self.assertTrue(os.path.exists(result_path))
+        self.assertGreater(os.path.getsize(result_path), 0)
     
+    @unittest.skipUnless(HAS_MATPLOTLIB, "Matplotlib not available for visualization generation")
     def test_visualization_generation_workflow(self):
         """Test visualization generation"""
         analyzer = CashAppAnalyzer(self.sample_csv_path)
@@ -89,22 +94,25 @@ class TestFullWorkflow(unittest.TestCase):
             # Test main dashboard
             fig = analyzer.create_visualizations()
             self.assertIsNotNone(fig)
+            plt.close(fig)
             
             # Test income visualizations
             income_fig = analyzer.create_income_visualizations()
             self.assertIsNotNone(income_fig)
+            plt.close(income_fig)
             
             # Test expense visualizations
             expense_fig = analyzer.create_expense_visualizations()
             self.assertIsNotNone(expense_fig)
+            plt.close(expense_fig)
             
             # Test cash flow visualizations
             cashflow_fig = analyzer.create_cash_flow_visualizations()
             self.assertIsNotNone(cashflow_fig)
+            plt.close(cashflow_fig)
             
-        except ImportError:
-            # Skip test if matplotlib not available
-            self.skipTest("Matplotlib not available for visualization generation")
+        finally:
+            plt.close('all')
     
     def test_date_range_analysis_workflow(self):
         """Test analysis with custom date ranges"""
@@ -172,5 +180,14 @@ class TestErrorHandling(unittest.TestCase):
             os.unlink(bad_csv.name)
 
 
+def _run_test_case(test_case_class):
+    """Run every test in a single TestCase class and report success"""
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_case_class)
+    return unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+
+
 if __name__ == '__main__':
-    unittest.main()
+    # Fixtures are per-class, so each TestCase can run in its own worker process
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_run_test_case, [TestFullWorkflow, TestErrorHandling]))
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Integration tests for the analyzer visualizations and the Top Expenses GUI tab
+
+Combines the former top expenses integration, top expenses visualization and
+visualization pipeline scripts so the heavy analyzer and matplotlib imports
+are paid once per worker.
+"""
+
+import sys
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib.pyplot as plt
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from analyzer.cashapp_analyzer import CashAppAnalyzer
+
+# The GUI pulls in optional widgets (tkcalendar), so only the GUI test depends on it
+try:
+    from gui.main_window import MainWindow
+    HAS_GUI = True
+except ImportError:
+    HAS_GUI = False
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    """Small CSV export covering income, rent and everyday card expenses"""
+    sample_data = [
+        {'Date': '2024-01-15', 'Description': 'Grocery Store', 'Amount': -75.50, 'Transaction Type': 'Cash Card'},
+        {'Date': '2024-01-16', 'Description': 'Gas Station', 'Amount': -45.00, 'Transaction Type': 'Cash Card'},
+        {'Date': '2024-01-17', 'Description': 'Coffee Shop', 'Amount': -8.50, 'Transaction Type': 'Cash Card'},
+        {'Date': '2024-01-18', 'Description': 'Apartment Rent', 'Amount': -1200.00, 'Transaction Type': 'Payment'},
+        {'Date': '2024-01-19', 'Description': 'Online Shopping', 'Amount': -125.00, 'Transaction Type': 'Cash Card'},
+        {'Date': '2024-01-20', 'Description': 'Restaurant', 'Amount': -65.00, 'Transaction Type': 'Cash Card'},
+        {'Date': '2024-01-21', 'Description': 'Utilities Bill', 'Amount': -85.00, 'Transaction Type': 'Payment'},
+        {'Date': '2024-01-22', 'Description': 'Subscription Service', 'Amount': -12.99, 'Transaction Type': 'Payment'},
+        {'Date': '2024-01-23', 'Description': 'Paycheck', 'Amount': 2500.00, 'Transaction Type': 'Payment'},
+        {'Date': '2024-01-24', 'Description': 'Movie Theater', 'Amount': -25.00, 'Transaction Type': 'Cash Card'},
+    ]
+
+    csv_path = tmp_path / 'sample_transactions.csv'
+    with open(csv_path, 'w') as csv_file:
+        csv_file.write('Date,Description,Amount,Transaction Type\n')
+        for row in sample_data:
+            csv_file.write(f"{row['Date']},{row['Description']},{row['Amount']},{row['Transaction Type']}\n")
+
+    return str(csv_path)
+
+
+@pytest.mark.serial
+@pytest.mark.skipif(not HAS_GUI, reason="GUI dependencies not available")
+def test_top_expenses_integration(tk_root, sample_csv):
+    """Test the complete integration of top expenses functionality"""
+    # Create main window on the shared hidden root
+    app = MainWindow(tk_root)
+    app.csv_file_path = sample_csv
+
+    # Test that analyzer can be created with the file
+    analyzer = CashAppAnalyzer(sample_csv)
+    analyzer.load_and_clean_data()
+    analyzer.categorize_transactions()
+    assert analyzer.df is not None and not analyzer.df.empty
+
+    # Test the create_top_expenses_visualizations method
+    fig = analyzer.create_top_expenses_visualizations()
+    assert fig is not None
+
+    # Display in the GUI; a failure here should surface rather than be swallowed
+    app.analyzer = analyzer
+    app._display_top_expenses_visualizations(fig)
+
+    # Flush pending events so the shared root is clean for the next test
+    tk_root.update_idletasks()
+    plt.close('all')
+
+
+def test_top_expenses_viz(sample_csv, tmp_path):
+    """Test the top expenses visualization functionality"""
+    analyzer = CashAppAnalyzer(sample_csv)
+    analyzer.load_and_clean_data()
+    analyzer.categorize_transactions()
+    assert len(analyzer.df) == 10
+
+    fig = analyzer.create_top_expenses_visualizations()
+    assert fig is not None
+
+    # Save a low-resolution proof image outside the source tree
+    output_path = tmp_path / 'top_expenses.png'
+    fig.savefig(output_path, dpi=72)
+    assert output_path.stat().st_size > 0
+
+    # Test with date range; only the returned figure matters here
+    start_date = datetime(2024, 1, 15)
+    end_date = datetime(2024, 1, 25)
+    fig_with_dates = analyzer.create_top_expenses_visualizations(start_date=start_date, end_date=end_date)
+    assert fig_with_dates is not None
+    plt.close('all')
+
+    # Verify expense data (excluding rent)
+    expense_data = analyzer.df[
+        (analyzer.df['Net_Amount'] < 0) &
+        (~analyzer.df['Category'].isin(['Housing & Rent']))
+    ]
+    assert not expense_data.empty
+
+    # Single bincount pass over category codes instead of a hash groupby
+    cats = pd.Categorical(expense_data['Category'])
+    totals = np.abs(np.bincount(cats.codes, weights=expense_data['Net_Amount'].to_numpy(),
+                                minlength=len(cats.categories)))
+    order = np.argsort(-totals, kind='stable')[:5]
+    top_categories = list(zip(cats.categories[order], totals[order]))
+    assert 0 < len(top_categories) <= 5
+    assert all(amount > 0 for _, amount in top_categories)
+
+
+def test_visualization_pipeline(sample_csv):
+    """Test that the income, expense and cash flow visualizations all build"""
+    analyzer = CashAppAnalyzer(sample_csv)
+    analyzer.load_and_clean_data()
+    analyzer.categorize_transactions()
+
+    # Income and expenses are daily line charts; cash flow includes top 5 non-rent expenses
+    for create in (analyzer.create_income_visualizations,
+                   analyzer.create_expense_visualizations,
+                   analyzer.create_cash_flow_visualizations):
+        fig = create()
+        assert fig is not None, f"{create.__name__} returned no figure"
+        plt.close(fig)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-v']))
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """
 Test script to verify the fixed visualizations work correctly
+
+The sample export is loaded and categorized once per module by the
+prepared_analyzer fixture; each visualization test reuses that analyzer.
 """
 
+import csv
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import pytest
 import sys
 import os
 from datetime import datetime, timedelta
@@ -12,115 +18,93 @@ from datetime import datetime, timedelta
 # Add the src directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-try:
-    from analyzer.cashapp_analyzer import CashAppAnalyzer
-    
-    # Create sample data to test the visualizations
-    print("Creating sample data for testing...")
-    # Generate sample transaction data
+from analyzer.cashapp_analyzer import CashAppAnalyzer
+
+
+def _build_sample_data():
+    """Generate a month of paychecks, everyday expenses and a few large purchases
+
+    Rows are selected with index masks over the month's days and each block is
+    built as whole columns, rather than appending a dict per transaction.
+    """
     dates = pd.date_range(start='2024-06-01', end='2024-06-30', freq='D')
-    sample_data = []
-    
-    for i, date in enumerate(dates):        # Add some income transactions (random paycheck-like amounts)
-        if i % 14 == 0:  # Bi-weekly paychecks
-            sample_data.append({
-                'Date': date,
-                'Notes': f'Paycheck {i//14 + 1}',
-                'Net Amount': 2500.00,
-                'Transaction Type': 'Standard Transfer',
-                'Category': 'Income'
-            })
-        
-        # Add some random expense transactions
-        if i % 3 == 0:  # Every few days
-            expenses = [
-                ('Grocery Store', -85.50, 'Food'),
-                ('Gas Station', -45.20, 'Transportation'),
-                ('Restaurant', -32.75, 'Food'),
-                ('Coffee Shop', -5.99, 'Food'),
-                ('Online Shopping', -125.00, 'Shopping'),
-            ]
-            expense = expenses[i % len(expenses)]
-            sample_data.append({
-                'Date': date,
-                'Notes': expense[0],
-                'Net Amount': expense[1],
-                'Transaction Type': 'Standard Transfer',
-                'Category': expense[2]
-            })
-    
+    day = np.arange(len(dates))
+
+    # Bi-weekly paychecks
+    pay_days = day[day % 14 == 0]
+    paychecks = pd.DataFrame({
+        'Date': dates[pay_days],
+        'Notes': [f'Paycheck {n}' for n in pay_days // 14 + 1],
+        'Net Amount': 2500.00,
+        'Category': 'Income',
+    })
+
+    # Everyday expenses every few days, cycling through the list by day
+    expenses = pd.DataFrame([
+        ('Grocery Store', -85.50, 'Food'),
+        ('Gas Station', -45.20, 'Transportation'),
+        ('Restaurant', -32.75, 'Food'),
+        ('Coffee Shop', -5.99, 'Food'),
+        ('Online Shopping', -125.00, 'Shopping'),
+    ], columns=['Notes', 'Net Amount', 'Category'])
+    expense_days = day[day % 3 == 0]
+    everyday = expenses.iloc[expense_days % len(expenses)].reset_index(drop=True)
+    everyday.insert(0, 'Date', dates[expense_days])
+
     # Add some large expense transactions for top 5 test
-    large_expenses = [
+    large = pd.DataFrame([
         ('Electronics Store - Laptop', -1200.00, 'Electronics'),
         ('Car Repair Shop', -850.00, 'Transportation'),
         ('Medical Bill', -650.00, 'Healthcare'),
         ('Home Depot - Tools', -420.00, 'Home'),
-        ('Best Buy - TV', -380.00, 'Electronics'),    ]
-    
-    for i, (desc, amount, cat) in enumerate(large_expenses):
-        sample_data.append({
-            'Date': dates[i + 5],
-            'Notes': desc,
-            'Net Amount': amount,
-            'Transaction Type': 'Standard Transfer',
-            'Category': cat
-        })
-    
-    # Create DataFrame
-    df = pd.DataFrame(sample_data)
-    
-    # Save to temporary CSV for testing
-    temp_csv = 'test_data.csv'
-    df.to_csv(temp_csv, index=False)
-    
-    print(f"Created test data with {len(df)} transactions")
-    print(f"Date range: {df['Date'].min().date()} to {df['Date'].max().date()}")
-    print(f"Sample transactions:")
-    print(df.head())
-    
-    # Test the analyzer
-    print("\nTesting CashApp Analyzer...")
-    analyzer = CashAppAnalyzer(temp_csv)
+        ('Best Buy - TV', -380.00, 'Electronics'),
+    ], columns=['Notes', 'Net Amount', 'Category'])
+    large.insert(0, 'Date', dates[5:5 + len(large)])
+
+    # A paycheck sorts ahead of an expense on the same day; large purchases go last
+    daily = pd.concat([paychecks, everyday], ignore_index=True).sort_values('Date', kind='stable')
+    sample = pd.concat([daily, large], ignore_index=True)
+    sample.insert(3, 'Transaction Type', 'Standard Transfer')
+    return sample
+
+
+@pytest.fixture(scope="module")
+def prepared_analyzer(tmp_path_factory):
+    """Analyzer over the sample export, loaded and categorized once for the module"""
+    df = _build_sample_data()
+    temp_csv = tmp_path_factory.mktemp('viz_fixes') / 'test_data.csv'
+
+    # A few dozen rows; the stdlib writer skips pandas's per-cell formatting
+    with open(temp_csv, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(df.columns)
+        writer.writerows(zip(df['Date'].dt.strftime('%Y-%m-%d'), *(df[col] for col in df.columns[1:])))
+
+    analyzer = CashAppAnalyzer(str(temp_csv))
     analyzer.load_and_clean_data()
     analyzer.categorize_transactions()
-    
-    print(f"Loaded {len(analyzer.df)} transactions")
-    print(f"Categories: {analyzer.df['Category'].unique()}")
-    
-    # Test the visualizations
-    print("\nTesting daily income visualization...")
-    try:
-        income_fig = analyzer.create_income_visualizations()
-        print("✓ Income visualization created successfully")
-        plt.close(income_fig)
-    except Exception as e:
-        print(f"✗ Income visualization failed: {e}")
-    
-    print("\nTesting daily expense visualization...")
-    try:
-        expense_fig = analyzer.create_expense_visualizations()
-        print("✓ Expense visualization created successfully")
-        plt.close(expense_fig)
-    except Exception as e:
-        print(f"✗ Expense visualization failed: {e}")
-    
-    print("\nTesting cash flow visualization with top 5 transactions...")
-    try:
-        cash_flow_fig = analyzer.create_cash_flow_visualizations()
-        print("✓ Cash flow visualization with top 5 transactions created successfully")
-        plt.close(cash_flow_fig)
-    except Exception as e:
-        print(f"✗ Cash flow visualization failed: {e}")
-    
-    # Clean up
-    if os.path.exists(temp_csv):
-        os.remove(temp_csv)
-    
-    print("\n✓ All visualization tests completed successfully!")
-    
-except ImportError as e:
-    print(f"Error importing analyzer: {e}")
-except Exception as e:
-    print(f"Test failed: {e}")
-    import traceback
-    traceback.print_exc()
+    yield analyzer
+
+    # Figures from every test are released together
+    plt.close('all')
+
+
+def test_sample_data_loaded(prepared_analyzer):
+    """Every generated transaction survives loading and is categorized"""
+    assert len(prepared_analyzer.df) == len(_build_sample_data())
+    assert prepared_analyzer.df['Category'].notna().all()
+
+
+@pytest.mark.parametrize('method', [
+    'create_income_visualizations',
+    'create_expense_visualizations',
+    'create_cash_flow_visualizations',  # includes the top 5 transactions
+])
+def test_visualization_builds(prepared_analyzer, method):
+    """Daily income, daily expense and cash flow charts all build from the shared analyzer"""
+    fig = getattr(prepared_analyzer, method)()
+    assert fig is not None, f"{method} returned no figure"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-v']))
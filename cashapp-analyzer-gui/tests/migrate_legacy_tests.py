@@ -6,9 +6,12 @@ into the new organized test structure.
 """
 
 import os
+import re
 import shutil
-import glob
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 # Define the project root and new test directory
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -19,7 +22,7 @@ LEGACY_TESTS_DIR = TESTS_DIR / "legacy"
 LEGACY_TESTS_DIR.mkdir(exist_ok=True)
 
 # Define mapping of old test files to new locations/purposes
-TEST_FILE_MAPPING = {
+TEST_FILE_MAPPING = MappingProxyType({
     # Root directory tests
     'test_viz_fixes.py': 'unit/test_visualizations.py',
     'test_simple_pdf.py': 'unit/test_pdf_generation.py', 
@@ -41,29 +44,64 @@ TEST_FILE_MAPPING = {
     'test_pdf_fix.py': 'unit/test_pdf_fixes.py',
     'test_comprehensive_pdf.py': 'integration/test_pdf_reports.py',
     'demo_pdf_fix.py': 'demos/pdf_fix_demo.py'
-}
+})
+
+# Inferred purpose of each legacy file, keyed like TEST_FILE_MAPPING
+FILE_PURPOSE_MAP = MappingProxyType({
+    'test_viz_fixes.py': 'Tests for visualization bug fixes',
+    'test_simple_pdf.py': 'Basic PDF generation tests',
+    'test_final_fixes.py': 'Tests for final bug fixes',
+    'test_enhanced_pdf.py': 'Enhanced PDF feature tests',
+    'test_pdf_demo.py': 'PDF generation demonstration',
+    'test_visualizations.py': 'Chart and visualization tests',
+    'test_pdf_comprehensive.py': 'Comprehensive PDF workflow tests',
+    'test_pdf_generation.py': 'Core PDF generation tests',
+    'test_income_debug.py': 'Income analysis debugging tests',
+    'test_last_month_viz.py': 'Monthly visualization tests',
+    'test_large_transactions.py': 'Large transaction handling tests',
+    'test_enhanced_app.py': 'Enhanced application feature tests',
+    'test_analyzer.py': 'Core analyzer functionality tests',
+    'test_pdf_fix.py': 'PDF bug fix tests',
+    'test_comprehensive_pdf.py': 'Complete PDF report tests',
+    'demo_pdf_fix.py': 'PDF fix demonstration'
+})
+
+# Structural lines are matched with a zero-width lookahead so keyword
+# alternatives can still match inside the same line
+ANALYSIS_PATTERN = re.compile(
+    r'^[ \t]*(?=(?P<imports>(?:import|from).*)$|(?P<functions>def .*)$|(?P<classes>class .*)$)'
+    r'|(?P<unittest>unittest)'
+    r'|(?P<matplotlib>matplotlib|plt)'
+    r'|(?P<pdf>(?i:pdf)|reportlab)',
+    re.MULTILINE
+)
+
+def _scan_for_scripts(directory, prefixes):
+    """Return sorted paths of .py files in a directory matching any of the name prefixes"""
+    if not directory.is_dir():
+        return []
+    
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.name.endswith('.py') and entry.name.startswith(prefixes) and entry.is_file()
+        )
 
 def find_legacy_test_files():
     """Find all legacy test files in the project"""
     test_files = []
     
     # Search in project root
-    root_tests = glob.glob(str(PROJECT_ROOT / "test_*.py"))
+    root_tests = _scan_for_scripts(PROJECT_ROOT, ('test_',))
     test_files.extend([(f, 'root') for f in root_tests])
     
-    # Search in GUI directory  
-    gui_tests = glob.glob(str(PROJECT_ROOT / "test_*.py"))
-    test_files.extend([(f, 'gui') for f in gui_tests])
-    
-    # Search in src directory
-    src_tests = glob.glob(str(PROJECT_ROOT / "src" / "test_*.py"))
+    # Search in src directory for test and demo files in a single pass
+    src_tests = _scan_for_scripts(PROJECT_ROOT / "src", ('test_', 'demo_'))
     test_files.extend([(f, 'src') for f in src_tests])
     
-    # Search for demo files
-    demo_files = glob.glob(str(PROJECT_ROOT / "src" / "demo_*.py"))
-    test_files.extend([(f, 'src') for f in demo_files])
-    
-    return test_files
+    # Keep only the first location seen for each path
+    seen = set()
+    return [(f, loc) for f, loc in test_files if not (f in seen or seen.add(f))]
 
 def backup_legacy_files():
     """Create backups of all legacy test files"""
@@ -77,7 +115,8 @@ def backup_legacy_files():
             backup_path = LEGACY_TESTS_DIR / f"{location}_{filename}"
             
             try:
-                shutil.copy2(file_path, backup_path)
+                # Contents only; backups do not need the original file metadata
+                shutil.copyfile(file_path, backup_path)
                 print(f"   ✅ Backed up: {filename} -> {backup_path}")
             except Exception as e:
                 print(f"   ❌ Failed to backup {filename}: {e}")
@@ -110,26 +149,7 @@ def generate_migration_plan():
 
 def get_file_purpose(filename):
     """Get the inferred purpose of a test file based on its name"""
-    purpose_map = {
-        'test_viz_fixes.py': 'Tests for visualization bug fixes',
-        'test_simple_pdf.py': 'Basic PDF generation tests',
-        'test_final_fixes.py': 'Tests for final bug fixes',
-        'test_enhanced_pdf.py': 'Enhanced PDF feature tests',
-        'test_pdf_demo.py': 'PDF generation demonstration',
-        'test_visualizations.py': 'Chart and visualization tests',
-        'test_pdf_comprehensive.py': 'Comprehensive PDF workflow tests',
-        'test_pdf_generation.py': 'Core PDF generation tests',
-        'test_income_debug.py': 'Income analysis debugging tests',
-        'test_last_month_viz.py': 'Monthly visualization tests',
-        'test_large_transactions.py': 'Large transaction handling tests',
-        'test_enhanced_app.py': 'Enhanced application feature tests',
-        'test_analyzer.py': 'Core analyzer functionality tests',
-        'test_pdf_fix.py': 'PDF bug fix tests',
-        'test_comprehensive_pdf.py': 'Complete PDF report tests',
-        'demo_pdf_fix.py': 'PDF fix demonstration'
-    }
-    
-    return purpose_map.get(filename, 'Unknown purpose')
+    return FILE_PURPOSE_MAP.get(filename, 'Unknown purpose')
 
 def analyze_test_file(file_path):
     """Analyze a test file to understand its contents"""
@@ -137,62 +157,68 @@ def analyze_test_file(file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Basic analysis
-        lines = content.split('\n')
-        imports = [line for line in lines if line.strip().startswith('import') or line.strip().startswith('from')]
-        functions = [line for line in lines if line.strip().startswith('def ')]
-        classes = [line for line in lines if line.strip().startswith('class ')]
+        # Single regex sweep tallies structural lines and library usage together
+        counts = Counter()
+        samples = {'imports': [], 'functions': []}
+        for match in ANALYSIS_PATTERN.finditer(content):
+            kind = match.lastgroup
+            counts[kind] += 1
+            if kind in samples and len(samples[kind]) < 3:
+                samples[kind].append(match.group(kind))
         
         return {
-            'lines': len(lines),
-            'imports': len(imports),
-            'functions': len(functions),
-            'classes': len(classes),
-            'has_unittest': 'unittest' in content,
-            'has_matplotlib': 'matplotlib' in content or 'plt' in content,
-            'has_pdf': 'pdf' in content.lower() or 'reportlab' in content,
-            'sample_imports': imports[:3],
-            'sample_functions': functions[:3]
+            'lines': content.count('\n') + 1,
+            'imports': counts['imports'],
+            'functions': counts['functions'],
+            'classes': counts['classes'],
+            'has_unittest': counts['unittest'] > 0,
+            'has_matplotlib': counts['matplotlib'] > 0,
+            'has_pdf': counts['pdf'] > 0,
+            'sample_imports': samples['imports'],
+            'sample_functions': samples['functions']
         }
     except Exception as e:
         return {'error': str(e)}
 
 def create_analysis_report():
     """Create a detailed analysis report of all legacy test files"""
-    legacy_files = find_legacy_test_files()
+    legacy_files = [(path, location) for path, location in find_legacy_test_files() if os.path.exists(path)]
+    
+    # Reading and scanning are independent per file, so overlap the I/O across threads;
+    # map() keeps results in input order so the report stays deterministic
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        analyses = list(executor.map(analyze_test_file, [path for path, _ in legacy_files]))
     
     print("\n🔍 Detailed Analysis Report:")
     print("=" * 80)
     
-    for file_path, location in legacy_files:
-        if os.path.exists(file_path):
-            filename = os.path.basename(file_path)
-            analysis = analyze_test_file(file_path)
-            
-            print(f"\n📄 {filename} ({location})")
-            print("-" * 50)
-            
-            if 'error' in analysis:
-                print(f"   ❌ Error analyzing file: {analysis['error']}")
-                continue
-            
-            print(f"   📊 Lines of code: {analysis['lines']}")
-            print(f"   📦 Import statements: {analysis['imports']}")
-            print(f"   🔧 Functions: {analysis['functions']}")
-            print(f"   🏗️  Classes: {analysis['classes']}")
-            print(f"   🧪 Uses unittest: {'Yes' if analysis['has_unittest'] else 'No'}")
-            print(f"   📈 Uses matplotlib: {'Yes' if analysis['has_matplotlib'] else 'No'}")
-            print(f"   📄 Uses PDF: {'Yes' if analysis['has_pdf'] else 'No'}")
-            
-            if analysis['sample_imports']:
-                print(f"   📝 Sample imports:")
-                for imp in analysis['sample_imports']:
-                    print(f"      {imp.strip()}")
-            
-            if analysis['sample_functions']:
-                print(f"   🔧 Sample functions:")
-                for func in analysis['sample_functions']:
-                    print(f"      {func.strip()}")
+    for (file_path, location), analysis in zip(legacy_files, analyses):
+        filename = os.path.basename(file_path)
+        
+        print(f"\n📄 {filename} ({location})")
+        print("-" * 50)
+        
+        if 'error' in analysis:
+            print(f"   ❌ Error analyzing file: {analysis['error']}")
+            continue
+        
+        print(f"   📊 Lines of code: {analysis['lines']}")
+        print(f"   📦 Import statements: {analysis['imports']}")
+        print(f"   🔧 Functions: {analysis['functions']}")
+        print(f"   🏗️  Classes: {analysis['classes']}")
+        print(f"   🧪 Uses unittest: {'Yes' if analysis['has_unittest'] else 'No'}")
+        print(f"   📈 Uses matplotlib: {'Yes' if analysis['has_matplotlib'] else 'No'}")
+        print(f"   📄 Uses PDF: {'Yes' if analysis['has_pdf'] else 'No'}")
+        
+        if analysis['sample_imports']:
+            print(f"   📝 Sample imports:")
+            for imp in analysis['sample_imports']:
+                print(f"      {imp.strip()}")
+        
+        if analysis['sample_functions']:
+            print(f"   🔧 Sample functions:")
+            for func in analysis['sample_functions']:
+                print(f"      {func.strip()}")
 
 def main():
     """Main migration script"""
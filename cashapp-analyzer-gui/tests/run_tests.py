@@ -7,8 +7,11 @@ It can be run directly or used by CI/CD systems.
 
 import sys
 import os
-import unittest
+import importlib.util
 import logging
+import subprocess
+
+import pytest
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -19,21 +22,44 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# pytest-xdist is optional; without it the suite simply runs in-process
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# Set by `python run_tests.py slow`; otherwise slow tests are skipped for a fast inner loop
+RUN_SLOW = False
+
+def _pytest_passes(args):
+    """Run pytest in a fresh interpreter so no modules or caches carry over between passes"""
+    ok_codes = (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED)
+    return subprocess.run([sys.executable, "-m", "pytest", *args]).returncode in ok_codes
+
+def _run_pytest(test_dir):
+    """Run a test directory across CPU cores, then its Tk-bound serial tests in one process
+    
+    A module that fails to import is reported as an error while the rest still run.
+    """
+    common_args = [test_dir, "-q", "--continue-on-collection-errors"]
+    parallel_args = common_args + ["-m", "not serial"]
+    serial_args = common_args + ["-m", "serial"]
+    if RUN_SLOW:
+        parallel_args.append("--runslow")
+        serial_args.append("--runslow")
+    if XDIST_AVAILABLE:
+        # loadfile keeps each module (and its module-scoped fixtures) on one worker
+        parallel_args += ["-n", "auto", "--dist=loadfile"]
+        serial_args += ["-n", "0"]
+    
+    parallel_ok = _pytest_passes(parallel_args)
+    serial_ok = _pytest_passes(serial_args)
+    return parallel_ok and serial_ok
+
 def run_unit_tests():
     """Run all unit tests"""
-    loader = unittest.TestLoader()
-    suite = loader.discover('unit', pattern='test_*.py')
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    return result.wasSuccessful()
+    return _run_pytest('unit')
 
 def run_integration_tests():
     """Run all integration tests"""
-    loader = unittest.TestLoader()
-    suite = loader.discover('integration', pattern='test_*.py')
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    return result.wasSuccessful()
+    return _run_pytest('integration')
 
 def run_all_tests():
     """Run all tests"""
@@ -70,9 +96,12 @@ if __name__ == '__main__':
             success = run_unit_tests()
         elif test_type == 'integration':
             success = run_integration_tests()
+        elif test_type == 'slow':
+            RUN_SLOW = True
+            success = run_all_tests()
         else:
             print(f"Unknown test type: {test_type}")
-            print("Usage: python run_tests.py [unit|integration]")
+            print("Usage: python run_tests.py [unit|integration|slow]")
             sys.exit(1)
     else:
         success = run_all_tests()
@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures for unit tests
+
+Loading and categorizing the sample CSV is the most expensive step in the
+unit suite, so read-only tests share a single prepared analyzer per session.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src and the tests directory (for fixtures) to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analyzer import cashapp_analyzer
+from analyzer.cashapp_analyzer import CashAppAnalyzer
+from fixtures.test_config import TestConfig
+
+
+@pytest.fixture(scope="session")
+def prepared_analyzer(tmp_path_factory):
+    """Analyzer with the sample data loaded and categorized; treat as read-only
+    
+    The sample is a CSV, so shared tests cover the string date and amount cleanup
+    that real exports go through (test_parquet_load_matches_csv covers Parquet).
+    It is written to a pytest temp directory, never the source tree.
+    """
+    sample_dir = tmp_path_factory.mktemp('sample_data')
+    sample_path = TestConfig.create_sample_csv(sample_dir / 'sample_data.csv')
+    analyzer = CashAppAnalyzer(sample_path)
+    analyzer.load_and_clean_data()
+    analyzer.categorize_transactions()
+    return analyzer
+
+
+@pytest.fixture
+def cold_caches():
+    """Empty the analyzer's categorization caches so the test runs the real rules"""
+    cashapp_analyzer._merchant_category.cache_clear()
+    cashapp_analyzer._CATEGORIZED_CACHE.clear()
+    yield
+    cashapp_analyzer._merchant_category.cache_clear()
+    cashapp_analyzer._CATEGORIZED_CACHE.clear()
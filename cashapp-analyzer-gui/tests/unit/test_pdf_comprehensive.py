@@ -4,10 +4,16 @@ Test the main analyzer's PDF generation functionality
 This tests the full analyzer with pandas if possible, fallback to pure Python if not
 """
 
+import csv
 import sys
 import os
+import importlib
+import tempfile
 import traceback
 
+import pytest
+
+@pytest.mark.slow
 def test_main_analyzer_pdf():
     """Test PDF generation using the main analyzer"""
     
@@ -38,7 +44,8 @@ def test_main_analyzer_pdf():
         analyzer.categorize_transactions()
         
         print("5. Generating PDF report for prior month...")
-        pdf_path = analyzer.generate_pdf_report()
+        # CI always measures the full build; locally an unchanged month is served from the PDF cache
+        pdf_path = analyzer.generate_pdf_report(force=bool(os.environ.get('CI')))
         
         if pdf_path and os.path.exists(pdf_path):
             file_size = os.path.getsize(pdf_path) / 1024
@@ -68,60 +75,32 @@ def test_main_analyzer_pdf():
         traceback.print_exc()
         return False
 
-def test_fallback_approach():
-    """Test that our fallback approach works"""
+def test_fallback_approach(tmp_path, monkeypatch, capsys):
+    """Test that our fallback approach still produces a PDF"""
+    pytest.importorskip("reportlab")
     
-    print("\n" + "="*60)
-    print("TESTING FALLBACK APPROACH")
-    print("="*60)
+    # Run the simple PDF generation in-process rather than in a fresh interpreter
+    monkeypatch.syspath_prepend(os.path.dirname(os.path.abspath(__file__)))
+    simple_pdf = importlib.import_module('test_simple_pdf')
     
-    try:
-        # Test if our simple PDF generation still works
-        print("Running simple PDF generation test...")
-        import subprocess
-        result = subprocess.run(['python', 'test_simple_pdf.py'], 
-                              capture_output=True, text=True, cwd='.')
-        
-        if result.returncode == 0:
-            print("✓ Fallback PDF generation works!")
-            return True
-        else:
-            print(f"✗ Fallback failed: {result.stderr}")
-            return False
-            
-    except Exception as e:
-        print(f"✗ Fallback test failed: {e}")
-        return False
-
-def main():
-    """Main test runner"""
-    print("Cash App PDF Generation Comprehensive Test")
-    print("="*60)
-    
-    # Test main analyzer approach
-    main_success = test_main_analyzer_pdf()
+    # The fallback reads cash_app_transactions.csv from the working directory
+    # and writes its report to the temp directory; keep both under tmp_path
+    first_day, _ = simple_pdf.prior_month_range()
+    with open(tmp_path / 'cash_app_transactions.csv', 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['Date', 'Transaction Type', 'Net Amount', 'Notes'])
+        writer.writerow([first_day.strftime('%Y-%m-01 09:00:00 EDT'), 'Deposits', '$2,500.00', 'Paycheck'])
+        writer.writerow([first_day.strftime('%Y-%m-02 12:30:00 EDT'), 'Cash Card', '-$12.50', 'STARBUCKS'])
+        writer.writerow([first_day.strftime('%Y-%m-03 18:45:00 EDT'), 'P2P', '-$40.00', 'Dinner split'])
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
     
-    # Test fallback approach
-    fallback_success = test_fallback_approach()
-    
-    print("\n" + "="*60)
-    print("TEST SUMMARY")
-    print("="*60)
-    print(f"Main Analyzer PDF:    {'✓ PASS' if main_success else '✗ FAIL'}")
-    print(f"Fallback PDF:         {'✓ PASS' if fallback_success else '✗ FAIL'}")
+    simple_pdf.main()
     
-    if main_success or fallback_success:
-        print("\n🎉 PDF GENERATION CAPABILITY CONFIRMED!")
-        print("You can generate monthly PDF reports for your Cash App data.")
-        
-        if main_success:
-            print("✓ Main app integration is working")
-        else:
-            print("ℹ️  Main app has pandas issues, but fallback method works")
-            
-    else:
-        print("\n❌ PDF GENERATION NOT WORKING")
-        print("Both main and fallback approaches failed.")
+    output = capsys.readouterr().out
+    assert "ERROR" not in output
+    assert list(tmp_path.glob('cash_app_simple_report_*.pdf')), "Fallback PDF was not created"
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(pytest.main([__file__, '-v']))
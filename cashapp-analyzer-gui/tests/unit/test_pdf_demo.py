@@ -9,24 +9,32 @@ import sys
 import tempfile
 from datetime import datetime, timedelta
 
-def test_pdf_with_charts():
-    """Create a comprehensive PDF report with charts using reportlab directly"""
+import pytest
+
+# Imported once at module scope so the skip decision is made at collection time
+try:
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    HAVE_DEPS = True
+except ImportError:
+    HAVE_DEPS = False
+
+pytestmark = pytest.mark.skipif(not HAVE_DEPS, reason="needs matplotlib+reportlab")
+
+def _build_demo_pdf(fig=None):
+    """Create a comprehensive PDF report with charts using reportlab directly
     
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib import colors
-        
-        # Try to import matplotlib for chart generation
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-interactive backend
-        import matplotlib.pyplot as plt
-        import numpy as np
-        
-    except ImportError as e:
-        print(f"❌ Required libraries not available: {e}")
+    Pass a 2x2 figure to draw into it instead of allocating a new one.
+    """
+    if not HAVE_DEPS:
+        print("❌ Required libraries not available: matplotlib and reportlab")
         return False
     
     # Set up output path
@@ -84,9 +92,16 @@ def test_pdf_with_charts():
     # Create sample charts
     story.append(Paragraph("Sample Visualizations", heading_style))
     
+    chart_path = None
     try:
-        # Create a comprehensive chart figure
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+        # Create a comprehensive chart figure, or reuse the one provided
+        owns_fig = fig is None
+        if owns_fig:
+            fig, _ = plt.subplots(2, 2, figsize=(12, 10))
+        else:
+            for ax in fig.axes:
+                ax.cla()
+        ax1, ax2, ax3, ax4 = fig.axes
         fig.suptitle('Cash App Analysis - Sample Charts', fontsize=16, fontweight='bold')
         
         # Chart 1: Income vs Expenses
@@ -143,20 +158,17 @@ def test_pdf_with_charts():
         ax4.set_title('Top Merchants', fontweight='bold')
         ax4.set_xlabel('Amount Spent ($)')
         
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.93)
+        fig.tight_layout()
+        fig.subplots_adjust(top=0.93)
         
         # Save chart as temporary image
         chart_path = os.path.join(tempfile.gettempdir(), "cash_app_demo_chart.png")
         fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        if owns_fig:
+            plt.close(fig)
         
-        # Add chart to PDF
+        # Add chart to PDF; the image is read when the document is built
         story.append(Image(chart_path, width=7.5*inch, height=6*inch))
-        
-        # Clean up temp file
-        if os.path.exists(chart_path):
-            os.remove(chart_path)
             
     except Exception as e:
         story.append(Paragraph(f"Chart generation error: {str(e)}", styles['Italic']))
@@ -183,25 +195,43 @@ def test_pdf_with_charts():
     
     story.append(Paragraph(tech_text, styles['Normal']))
     
-    # Build PDF
-    doc.build(story)
+    # Build PDF, then clean up the temporary chart image
+    try:
+        doc.build(story)
+    finally:
+        if chart_path and os.path.exists(chart_path):
+            os.remove(chart_path)
     
     print(f"✅ Enhanced PDF demo created: {output_path}")
+    return output_path
+
+@pytest.mark.slow
+def test_pdf_with_charts(request, blank_2x2_fig):
+    """Benchmark building the demo PDF; warmup is skipped since imports are paid in conftest
     
-    try:
-        import subprocess
-        subprocess.run(['start', output_path], shell=True, check=True)
-        print("✅ Enhanced PDF opened successfully")
-        return True
-    except:
-        print("⚠️  Could not automatically open PDF, but file was created")
-        return True
+    Without pytest-benchmark the PDF is simply built once.
+    """
+    if request.config.pluginmanager.hasplugin('benchmark'):
+        benchmark = request.getfixturevalue('benchmark')
+        output_path = benchmark.pedantic(
+            _build_demo_pdf, args=(blank_2x2_fig,), warmup_rounds=0, rounds=3, iterations=1
+        )
+    else:
+        output_path = _build_demo_pdf(blank_2x2_fig)
+    assert output_path and os.path.exists(output_path)
 
 def main():
     print("Cash App Enhanced PDF Generation Demo")
     print("=" * 45)
     
-    success = test_pdf_with_charts()
+    success = _build_demo_pdf()
+    if success:
+        try:
+            import subprocess
+            subprocess.run(['start', success], shell=True, check=True)
+            print("✅ Enhanced PDF opened successfully")
+        except:
+            print("⚠️  Could not automatically open PDF, but file was created")
     
     print("\n" + "=" * 45)
     if success:
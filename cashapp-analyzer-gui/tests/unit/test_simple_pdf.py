@@ -5,82 +5,145 @@ Tests the PDF generation with basic data processing
 """
 
 import csv
+import functools
+from collections import Counter, defaultdict
+from array import array
 from datetime import datetime, timedelta
 import os
+import re
 import tempfile
 
-# PDF generation imports
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    print("ReportLab successfully imported!")
-except ImportError as e:
-    print(f"ReportLab import failed: {e}")
-    exit(1)
+# Drops currency symbols and thousands separators from amounts in one pass
+AMOUNT_STRIP_TABLE = str.maketrans('', '', '$,')
+
+# Categories decided by transaction type alone, looked up in one hash probe
+TRANSACTION_TYPE_CATEGORIES = {
+    'Bitcoin Buy': 'Investment (Bitcoin)',           # Bitcoin purchases = Investment/Savings
+    'Bitcoin Recurring Buy': 'Investment (Bitcoin)',
+    'Savings Internal Transfer': 'Savings Transfer',  # Money Movement
+    'Deposits': 'Deposits',                           # Money Movement
+    'P2P': 'P2P Expenses',
+}
+
+# Merchant keywords per category, checked in order; each list is compiled into
+# one alternation so a note is scanned once per category, not once per keyword
+MERCHANT_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in (
+        ('Food & Dining', ['CHIPOTLE', 'MCDONALD', 'STARBUCKS', 'WAFFLE HOUSE', 'WHATABURGER']),
+        ('Entertainment & Media', ['NETFLIX', 'SPOTIFY', 'YOUTUBE']),
+    )
+]
 
-def process_csv_data(csv_path):
-    """Process CSV data without pandas"""
-    transactions = []
+def prior_month_range(today=None):
+    """Return the (first, last) datetimes of the month before today"""
+    today = today or datetime.now()
+    first_day_current_month = today.replace(day=1)
+    last_day_prior_month = first_day_current_month - timedelta(days=1)
+    first_day_prior_month = last_day_prior_month.replace(day=1)
+    return first_day_prior_month, last_day_prior_month
+
+def process_csv_data(csv_path, start=None, end=None):
+    """Process CSV data without pandas
     
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
+    Transactions are returned column-wise: a dict of parallel sequences, one
+    per field, with amounts packed into an array of doubles. When start/end
+    are given, rows dated outside that window are dropped as they stream
+    past, so only the reported slice is ever held in memory.
+    """
+    transactions = {
+        'date': [],
+        'amount': array('d'),
+        'notes': [],
+        'transaction_type': [],
+        'category': [],
+        'merchant': [],
+    }
+    
+    # Timestamps and amounts repeat heavily in an export, so each distinct
+    # string is parsed once and later rows are a dict lookup
+    parsed_dates = {}
+    parsed_amounts = {}
+    
+    # Bad rows are reported together after the loop in a single write
+    row_errors = []
+    
+    # A window inside one calendar month lets rows be rejected on their
+    # 'YYYY-MM' text prefix before any parsing happens
+    month_prefix = None
+    if start is not None and end is not None and (start.year, start.month) == (end.year, end.month):
+        month_prefix = start.strftime('%Y-%m')
+    
+    with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        # Rows are read as plain lists; the header is resolved to column
+        # positions once instead of building a dict for every row
+        columns = {name: i for i, name in enumerate(next(reader, []))}
+        date_col = columns.get('Date')
+        amount_col = columns.get('Net Amount')
+        notes_col = columns.get('Notes')
+        type_col = columns.get('Transaction Type')
+        merchant_col = columns.get('Name of sender/receiver')
         for row in reader:
+            if not row:
+                continue
             # Clean and process the row
             try:
+                notes = row[notes_col] if notes_col is not None else ''
+                transaction_type = row[type_col] if type_col is not None else ''
+                
                 # Parse date (remove timezone and parse ISO format)
-                date_str = row['Date'].strip()
+                date_str = row[date_col].strip()
+                if month_prefix and not date_str.startswith(month_prefix):
+                    continue
                 # Remove timezone abbreviation (EDT, EST)
                 date_str = date_str.split(' ')[0] + ' ' + date_str.split(' ')[1]  # Just date and time
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+                date_obj = parsed_dates.get(date_str)
+                if date_obj is None:
+                    date_obj = parsed_dates[date_str] = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+                if (start is not None and date_obj < start) or (end is not None and date_obj > end):
+                    continue
                 
                 # Parse amount
-                net_amount_str = row['Net Amount'].replace('$', '').replace(',', '')
-                net_amount = float(net_amount_str)
+                amount_str = row[amount_col]
+                net_amount = parsed_amounts.get(amount_str)
+                if net_amount is None:
+                    net_amount = parsed_amounts[amount_str] = float(amount_str.translate(AMOUNT_STRIP_TABLE))
                 
                 # Categorize based on our rules
-                category = categorize_transaction(row)
+                category = categorize_transaction(transaction_type, notes.upper())
                 
-                transactions.append({
-                    'date': date_obj,
-                    'amount': net_amount,
-                    'notes': row.get('Notes', ''),
-                    'transaction_type': row.get('Transaction Type', ''),
-                    'category': category,
-                    'merchant': row.get('Name of sender/receiver', '')
-                })
-            except Exception as e:
-                print(f"Error processing row: {e}")
+                transactions['date'].append(date_obj)
+                transactions['amount'].append(net_amount)
+                transactions['notes'].append(notes)
+                transactions['transaction_type'].append(transaction_type)
+                transactions['category'].append(category)
+                transactions['merchant'].append(row[merchant_col] if merchant_col is not None else '')
+            except (IndexError, TypeError, ValueError) as e:
+                # Short rows, a missing Date/Net Amount column, or unparseable
+                # values; anything else is a real bug and propagates
+                row_errors.append(f"Error processing row: {e}")
                 continue
     
+    if row_errors:
+        print('\n'.join(row_errors))
+    
     return transactions
 
-def categorize_transaction(row):
-    """Apply our custom categorization rules"""
-    transaction_type = row.get('Transaction Type', '')
-    notes = row.get('Notes', '').upper()
+def categorize_transaction(transaction_type, notes):
+    """Apply our custom categorization rules
+    
+    Notes are expected upper-cased already; the caller does that once per row.
+    """
     
     # Rule 1: Energy Auth transactions = Income
     if 'THE ENERGY AUTHO DIRECT DEP' in notes:
         return 'Income'
     
-    # Rule 2: Bitcoin purchases = Investment/Savings
-    if transaction_type in ['Bitcoin Buy', 'Bitcoin Recurring Buy']:
-        return 'Investment (Bitcoin)'
-    
-    # Rule 3: Savings Internal Transfer = Money Movement
-    if transaction_type == 'Savings Internal Transfer':
-        return 'Savings Transfer'
-    
-    # Rule 4: Deposits = Money Movement
-    if transaction_type == 'Deposits':
-        return 'Deposits'
-    
-    # Rule 5: P2P = Expenses
-    if transaction_type == 'P2P':
-        return 'P2P Expenses'
+    # Rules 2-5: fixed categories by transaction type
+    category = TRANSACTION_TYPE_CATEGORIES.get(transaction_type)
+    if category is not None:
+        return category
     
     # Rule 6: Cash Card transactions - categorize by merchant
     if transaction_type == 'Cash Card':
@@ -89,38 +152,64 @@ def categorize_transaction(row):
     return 'Other'
 
 def categorize_merchant(notes):
-    """Categorize cash card expenses by merchant"""
-    notes_upper = notes.upper()
-    
-    # Food & Dining
-    food_keywords = ['CHIPOTLE', 'MCDONALD', 'STARBUCKS', 'WAFFLE HOUSE', 'WHATABURGER']
-    if any(keyword in notes_upper for keyword in food_keywords):
-        return 'Food & Dining'
+    """Categorize cash card expenses by merchant
     
-    # Entertainment & Media
-    entertainment_keywords = ['NETFLIX', 'SPOTIFY', 'YOUTUBE']
-    if any(keyword in notes_upper for keyword in entertainment_keywords):
-        return 'Entertainment & Media'
+    Like categorize_transaction, this expects notes that are already upper-cased.
+    """
+    for category, pattern in MERCHANT_PATTERNS:
+        if pattern.search(notes):
+            return category
     
     # Default
     return 'Other Expenses'
 
+@functools.lru_cache(maxsize=1)
+def report_styles():
+    """Build the sample stylesheet and title style once per process"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    return styles, title_style
+
 def generate_simple_pdf_report(transactions, output_path=None):
-    """Generate a PDF report from transaction data"""
+    """Generate a PDF report from transaction data
     
-    # Calculate date range for prior month
-    today = datetime.now()
-    first_day_current_month = today.replace(day=1)
-    last_day_prior_month = first_day_current_month - timedelta(days=1)
-    first_day_prior_month = last_day_prior_month.replace(day=1)
+    ReportLab is imported here, on first use, so parsing and a missing CSV
+    never pay for it.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib import colors
     
-    # Filter transactions for prior month
-    prior_month_transactions = [
-        t for t in transactions 
-        if first_day_prior_month <= t['date'] <= last_day_prior_month
-    ]
+    # Calculate date range for prior month
+    first_day_prior_month, last_day_prior_month = prior_month_range()
+    
+    # Filter the prior month and accumulate every total in a single pass
+    transaction_count = 0
+    total_income = 0
+    total_expenses = 0
+    category_counts = Counter()
+    category_totals = defaultdict(float)
+    for date, amount, category in zip(transactions['date'], transactions['amount'], transactions['category']):
+        if not first_day_prior_month <= date <= last_day_prior_month:
+            continue
+        transaction_count += 1
+        if amount > 0:
+            total_income += amount
+        elif amount < 0:
+            total_expenses += amount
+        
+        category_counts[category] += 1
+        category_totals[category] += amount
     
-    if not prior_month_transactions:
+    if not transaction_count:
         print("No transactions found for prior month")
         return None
     
@@ -134,30 +223,20 @@ def generate_simple_pdf_report(transactions, output_path=None):
     # Create PDF document
     doc = SimpleDocTemplate(output_path, pagesize=letter)
     story = []
-    styles = getSampleStyleSheet()
+    styles, title_style = report_styles()
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1  # Center alignment
-    )
-    
     title = f"Cash App Report - {first_day_prior_month.strftime('%B %Y')}"
     story.append(Paragraph(title, title_style))
     story.append(Spacer(1, 12))
     
     # Summary statistics
-    total_income = sum(t['amount'] for t in prior_month_transactions if t['amount'] > 0)
-    total_expenses = sum(t['amount'] for t in prior_month_transactions if t['amount'] < 0)
     net_cash_flow = total_income + total_expenses
     
     summary_text = f"""
     <b>Summary for {first_day_prior_month.strftime('%B %Y')}</b><br/>
     <br/>
-    Total Transactions: {len(prior_month_transactions)}<br/>
+    Total Transactions: {transaction_count}<br/>
     Total Income: ${total_income:,.2f}<br/>
     Total Expenses: ${abs(total_expenses):,.2f}<br/>
     Net Cash Flow: ${net_cash_flow:,.2f}<br/>
@@ -166,24 +245,15 @@ def generate_simple_pdf_report(transactions, output_path=None):
     story.append(Paragraph(summary_text, styles['Normal']))
     story.append(Spacer(1, 20))
     
-    # Category breakdown
-    category_summary = {}
-    for t in prior_month_transactions:
-        category = t['category']
-        if category not in category_summary:
-            category_summary[category] = {'count': 0, 'total': 0}
-        category_summary[category]['count'] += 1
-        category_summary[category]['total'] += t['amount']
-    
     # Create category table
     story.append(Paragraph("<b>Category Breakdown</b>", styles['Heading2']))
     
     table_data = [['Category', 'Transactions', 'Total Amount']]
-    for category, data in sorted(category_summary.items()):
+    for category in sorted(category_counts):
         table_data.append([
             category,
-            str(data['count']),
-            f"${data['total']:,.2f}"
+            str(category_counts[category]),
+            f"${category_totals[category]:,.2f}"
         ])
     
     table = Table(table_data)
@@ -219,8 +289,9 @@ def main():
     
     try:
         print("1. Processing CSV data...")
-        transactions = process_csv_data(csv_path)
-        print(f"   Loaded {len(transactions)} transactions")
+        # Only the prior month is reported, so nothing else is kept
+        transactions = process_csv_data(csv_path, *prior_month_range())
+        print(f"   Loaded {len(transactions['date'])} transactions")
         
         print("2. Generating PDF report...")
         pdf_path = generate_simple_pdf_report(transactions)
@@ -234,7 +305,7 @@ def main():
             try:
                 os.startfile(pdf_path)
                 print("Opening PDF...")
-            except:
+            except (AttributeError, OSError):
                 print("Note: Please open the PDF manually.")
                 
         else: